@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure first record latency with and without rule index snapshots.
+
+.. code-block:: console
+
+    $ python benchmarks/first_record_latency.py --runs 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+from dojson.contrib.marc21 import marc21
+marc21.snapshot_dir = {snapshot_dir!r}
+marc21.do({{'245__': {{'a': 'Title'}}, '100__': {{'a': 'Name'}}}})
+print(time.perf_counter() - start)
+"""
+
+
+def run(snapshot_dir, runs):
+    """Return first record latencies in milliseconds."""
+    code = SCRIPT.format(snapshot_dir=snapshot_dir)
+    return [
+        float(subprocess.check_output([sys.executable, '-c', code])) * 1000
+        for _ in range(runs)
+    ]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        # Write the snapshot before measuring.
+        run(snapshot_dir, 1)
+        for label, directory in (('build', None), ('snapshot', snapshot_dir)):
+            timings = run(directory, args.runs)
+            print('{0:>10}: median {1:7.1f} ms, min {2:7.1f} ms'.format(
+                label, statistics.median(timings), min(timings)))
+
+
+if __name__ == '__main__':
+    main()
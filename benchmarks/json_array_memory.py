@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure peak memory and time of loading a large JSON array.
+
+The default size is 2 GB, the ``whole`` case decoding the array at once
+needs several times more memory than that.
+
+.. code-block:: console
+
+    $ python benchmarks/json_array_memory.py --size 2048
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import simplejson as json
+
+RECORD = {
+    '001': '{0}',
+    '24510': {'a': 'Title {0}', 'c': 'Author'},
+    '520__': {'a': 'Summary ' * 20},
+    '650_7': [{'a': 'Subject', '2': 'source'}] * 3,
+}
+
+SCRIPTS = {
+    'incremental': """
+from dojson.utils import load
+with open({path!r}, 'rb') as stream:
+    count = sum(1 for _ in load(stream))
+""",
+    'whole': """
+import codecs
+import simplejson as json
+with open({path!r}, 'rb') as stream:
+    count = len(json.load(codecs.getreader('utf-8')(stream)))
+""",
+}
+
+MEASURE = """
+import resource
+import time
+start = time.perf_counter()
+{script}
+print(count, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+      time.perf_counter() - start)
+"""
+
+
+def write_array(path, size):
+    """Write a JSON array of records of at least given size in bytes."""
+    template = json.dumps(RECORD)
+    records = 0
+    with open(path, 'w') as stream:
+        stream.write('[')
+        while stream.tell() < size:
+            if records:
+                stream.write(', ')
+            stream.write(template.replace('{0}', str(records)))
+            records += 1
+        stream.write(']\n')
+    return records
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=2048,
+                        help='size of the array in MB')
+    parser.add_argument('--cases', nargs='+', default=sorted(SCRIPTS),
+                        choices=sorted(SCRIPTS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'records.json')
+        records = write_array(path, args.size * 1024 * 1024)
+        print('{0:>12}: {1:8.1f} MB, {2} records'.format(
+            'file', os.path.getsize(path) / 1024 / 1024, records))
+        for case in args.cases:
+            script = MEASURE.format(script=SCRIPTS[case].format(path=path))
+            count, rss, seconds = subprocess.check_output([
+                sys.executable, '-c', script
+            ]).split()
+            assert int(count) == records
+            print('{0:>12}: {1:8.1f} MB peak RSS {2:8.1f} s'.format(
+                case, int(rss) / 1024, float(seconds)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure building records from MARCXML.
+
+.. code-block:: console
+
+    $ python benchmarks/marcxml_parsing.py --copies 20
+"""
+
+import argparse
+import io
+import os
+import timeit
+
+from lxml import etree
+
+from dojson.contrib.marc21.utils import create_record, load, split_stream
+
+DATA = os.path.join(
+    os.path.dirname(__file__), os.pardir, 'tests', 'data', 'test_1.xml'
+)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    with open(DATA, 'rb') as stream:
+        elements = list(split_stream(stream, clear=False))
+    records = [etree.tostring(element) for element in elements] * args.copies
+    collection = b''.join(
+        [b'<collection xmlns="http://www.loc.gov/MARC21/slim">'] + records +
+        [b'</collection>']
+    )
+
+    cases = (
+        ('bytes', lambda: [create_record(record) for record in records]),
+        ('load', lambda: list(load(io.BytesIO(collection)))),
+    )
+    for label, function in cases:
+        timing = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print('{0:>10}: {1:8.1f} us per record'.format(
+            label, timing / len(records) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Compare MARCXML serialization with lxml and with direct text building.
+
+.. code-block:: console
+
+    $ python benchmarks/marcxml_serialization.py --copies 200
+"""
+
+import argparse
+import glob
+import io
+import os
+import timeit
+
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.marc21.utils import load
+from dojson.contrib.to_marc21 import marcxml, to_marc21, utils
+
+DATA = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'data')
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    records = []
+    for path in sorted(glob.glob(os.path.join(DATA, 'test_*.xml'))):
+        for record in load(path):
+            records.append(to_marc21.do(marc21.do(record)))
+    records = records * args.copies
+
+    for pretty_print in (False, True):
+        outputs = []
+        for label, module in (('lxml', utils), ('direct', marcxml)):
+            def dump():
+                stream = io.BytesIO()
+                module.dump_stream(records, stream, pretty_print=pretty_print)
+                return stream.getvalue()
+
+            outputs.append(dump())
+            timing = min(timeit.repeat(dump, number=1, repeat=args.repeat))
+            print('{0:>8} {1:>6}: {2:8.1f} us per record'.format(
+                'pretty' if pretty_print else 'compact', label,
+                timing / len(records) * 1e6))
+        assert outputs[0] == outputs[1]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure peak memory of loading a large MARCXML collection.
+
+.. code-block:: console
+
+    $ python benchmarks/split_stream_memory.py --records 100000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+RECORD = (
+    '<record><controlfield tag="001">{0}</controlfield>'
+    '<datafield tag="245" ind1=" " ind2=" ">'
+    '<subfield code="a">Title {0}</subfield></datafield>'
+    '<datafield tag="520" ind1=" " ind2=" ">'
+    '<subfield code="a">{1}</subfield></datafield></record>\n'
+)
+
+SCRIPT = """
+import resource
+from dojson.contrib.marc21.utils import load
+with open({path!r}, 'rb') as stream:
+    count = sum(1 for _ in load(stream, clear={clear!r}))
+print(count, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_collection(path, records):
+    """Write a MARCXML collection with given number of records."""
+    with open(path, 'w') as stream:
+        stream.write('<collection xmlns="http://www.loc.gov/MARC21/slim">\n')
+        for number in range(records):
+            stream.write(RECORD.format(number, 'Summary ' * 20))
+        stream.write('</collection>\n')
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'collection.xml')
+        write_collection(path, args.records)
+        print('{0:>10}: {1:8.1f} MB'.format(
+            'file', os.path.getsize(path) / 1024 / 1024))
+        for label, clear in (('clear', True), ('keep', False)):
+            count, rss = subprocess.check_output([
+                sys.executable, '-c', SCRIPT.format(path=path, clear=clear)
+            ]).split()
+            assert int(count) == args.records
+            print('{0:>10}: {1:8.1f} MB peak RSS'.format(
+                label, int(rss) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure conversion of records where half of the fields have no rule.
+
+Keys without a rule are signalled to the exception handlers directly, the
+``raising`` timings restore raising and catching of these exceptions.
+
+.. code-block:: console
+
+    $ python benchmarks/unmapped_keys.py --records 20000
+"""
+
+import argparse
+import contextlib
+import timeit
+
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.to_marc21 import to_marc21
+from dojson.overdo import Overdo
+from dojson.utils import GroupableOrderedDict
+
+
+def make_record(number):
+    """Return record with one local 9xx field per mapped field."""
+    fields = [
+        ('001', str(number)),
+        ('245__', GroupableOrderedDict([('a', 'Title {0}'.format(number))])),
+        ('500__', GroupableOrderedDict([('a', 'Note')])),
+        ('650_7', GroupableOrderedDict([('a', 'Topic'), ('2', 'local')])),
+    ]
+    local = [
+        ('9{0:02d}__'.format(i), GroupableOrderedDict([('a', 'Local')]))
+        for i in range(len(fields))
+    ]
+    return GroupableOrderedDict(
+        [field for pair in zip(fields, local) for field in pair]
+    )
+
+
+def make_reverse_record(record):
+    """Return translated record with one unknown name per mapped name."""
+    data = marc21.do(record)
+    order = []
+    for number, name in enumerate(data.pop('__order__')):
+        local = 'local_field_{0}'.format(number)
+        data[local] = {'a': 'Local'}
+        order.extend((name, local))
+    data['__order__'] = order
+    return data
+
+
+def _raising_handle(exc, handlers, output, key, value):
+    """Raise and catch the exception before passing it to its handler."""
+    try:
+        raise exc
+    except Exception as caught:
+        Overdo._handle(caught, handlers, output, key, value)
+
+
+@contextlib.contextmanager
+def raising(model):
+    """Signal ignored keys and missing rules by raising exceptions."""
+    model._handle = _raising_handle
+    try:
+        yield
+    finally:
+        del model._handle
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    records = [make_record(number) for number in range(args.records)]
+    reverse = [make_reverse_record(record) for record in records]
+    for model, data in ((marc21, records), (to_marc21, reverse)):
+        name = model.entry_point_group.rsplit('.', 1)[-1]
+        timings = {}
+        for signal in ('direct', 'raising'):
+            with raising(model) if signal == 'raising' else \
+                    contextlib.nullcontext():
+                timings[signal] = min(timeit.repeat(
+                    lambda: [model.do(record) for record in data],
+                    number=1, repeat=args.repeat,
+                )) / len(data) * 1e6
+            print('{0:>10} {1:>7}: {2:8.1f} us per record'.format(
+                name, signal, timings[signal]
+            ))
+        print('{0:>10} speedup: {1:8.2f}x'.format(
+            name, timings['raising'] / timings['direct']
+        ))
+
+
+if __name__ == '__main__':
+    main()
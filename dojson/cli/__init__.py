@@ -61,6 +61,13 @@ In similar way it is possible to specify different output serializer (``-d``).
       </record>
     </collection>
 
+Records can be read and written as JSON Lines too, one record per line, so
+that the output can be split or concatenated with standard tools.
+
+.. code-block:: console
+
+    $ dojson -i example.xml -l marcxml -d jsonl do marc21 | split -l 1000
+
 Command chaining
 ----------------
 
@@ -81,25 +88,77 @@ Second example shows easy verification that rules produce an identity function.
     $ dojson -l marcxml -d marcxml do marc21 do to_marc21 < example.xml | \
       diff - example.xml
 
+Compression
+-----------
+
+Input compressed with gzip, bzip2 or xz is decompressed while it is read.
+Output is compressed according to the extension of the ``-o`` file or the
+``--compress`` option.
+
+.. code-block:: console
+
+    $ dojson -i records.xml.gz -l marcxml -o records.json.xz do marc21
+    $ dojson -i records.xml.bz2 -l marcxml --compress gzip do marc21 > out.gz
+
+Parallel processing
+-------------------
+
+Records can be processed by several worker processes using ``-j <N>``.
+Consecutive ``do``, ``schema`` and ``validate`` commands run together in the
+workers while loading and dumping stay in the main process.  The output
+keeps the order of the input.
+
+.. code-block:: console
+
+    $ dojson -j 4 -i records.xml -l marcxml do marc21 > records.json
+
+Indexes
+-------
+
+The ``index`` command scans an input file once and saves the byte offsets
+of its records next to it.  Readers such as
+:class:`dojson.contrib.marc21.utils.Reader` use the index to parse single
+records by number or by ``001`` control number.  Compressed files cannot be
+indexed.
+
+.. code-block:: console
+
+    $ dojson -i records.xml -l marcxml index
+    Indexed 1000 records in records.xml.idx
+
 Extensibility
 -------------
 
 New commands, loaders, dumpers, or rules can be provided via entry points.
 
-- ``dojson.cli`` commands that return a processor acception an iterator;
+- ``dojson.cli`` commands that return a processor acception an iterator,
+  processors can have a ``stage`` attribute with a picklable function
+  processing one item that is used in worker processes;
 - ``dojson.cli.load`` functions expecting a stream and returning Python dict or
-  iterator;
+  iterator, functions can have a ``__parallel__`` attribute with a function
+  expecting a file path, number of jobs and ``stages`` applied to every
+  record by its workers, used for regular input files when more than one
+  job is requested, and a ``__reader__`` attribute with a
+  :class:`dojson.offsets.IndexedReader` subclass, or a function with the
+  same arguments returning a reader, used by the ``index`` command;
 - ``dojson.cli.dump`` functions expecting a Python object and returning
-  ``str``;
+  ``str``, functions can have a ``__stream__`` attribute with a function
+  expecting an iterator and a binary file object that writes items as they
+  come including any final new line;
 - ``dojson.cli.rule`` instances of :class:`dojson.overdo.Overdo` with loaded
   rules.
 """
 
+import functools
+import itertools
+import os
 import sys
 
 import click
 
 from .._compat import stdin
+from ..compression import CODECS, detect, open_input, open_output
+from ..parallel import Executor, chain
 from .utils import open_entry_point, with_plugins
 
 
@@ -111,12 +170,51 @@ from .utils import open_entry_point, with_plugins
               default='json')
 @click.option('-d', '--dump', callback=open_entry_point('dojson.cli.dump'),
               default='json')
+@click.option('-j', '--jobs', type=click.IntRange(min=1), default=1,
+              help='Number of worker processes for processing records.')
+@click.option('-o', '--output', type=click.Path(dir_okay=False),
+              help='Output file, compressed according to its extension.')
+@click.option('--compress', type=click.Choice(sorted(CODECS)),
+              help='Compress the output.')
 def cli(**kwargs):
     """Command line interface."""
 
 
+def _write(source, dump, output, compression):
+    """Write dumped data into the output file or standard output."""
+    write = getattr(dump, '__stream__', None)
+    if write is None and output is None and compression is None:
+        click.echo(dump(source))
+        return
+
+    if output is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    else:
+        stream = open(output, 'wb')
+
+    try:
+        target = stream
+        if compression is not None:
+            target = open_output(stream, compression)
+        if write is None:
+            data = dump(source)
+            if not isinstance(data, bytes):
+                data = data.encode('utf-8')
+            target.write(data + b'\n')
+        else:
+            write(source, target)
+        if target is not stream:
+            target.close()
+    finally:
+        if output is None:
+            stream.flush()
+        else:
+            stream.close()
+
+
 @cli.result_callback()
-def process_pipeline(processors, source, load, dump):
+def process_pipeline(processors, source, load, dump, jobs, output, compress):
     """Call data processors."""
     def loader(iterator):
         data = load(iterator)
@@ -126,9 +224,38 @@ def process_pipeline(processors, source, load, dump):
             for item in data:
                 yield item
 
-    source = loader(source)
+    def parallel(iterator, stages):
+        with Executor(jobs=jobs) as executor:
+            function = functools.partial(chain, stages)
+            for item in executor.map(function, iterator):
+                yield item
+
+    load_parallel = getattr(load, '__parallel__', None)
+    path = getattr(source, 'name', None)
+    stream = open_input(source)
+    if jobs > 1 and load_parallel is not None and stream is source and \
+            isinstance(path, str) and os.path.isfile(path):
+        # Leading stages run in the loader workers next to parsing.
+        stages = list(itertools.takewhile(bool, (
+            getattr(processor, 'stage', None) for processor in processors
+        )))
+        source = load_parallel(path, jobs=jobs, stages=stages)
+        processors = processors[len(stages):]
+    else:
+        source = loader(stream)
+    stages = []
 
     for processor in processors:
+        stage = getattr(processor, 'stage', None)
+        if jobs > 1 and stage is not None:
+            stages.append(stage)
+            continue
+        if stages:
+            source = parallel(source, stages)
+            stages = []
         source = processor(source)
 
-    click.echo(dump(source))
+    if stages:
+        source = parallel(source, stages)
+
+    _write(source, dump, output, compress or detect(name=output))
@@ -3,12 +3,14 @@
 
 """Define chainable commands for processing loaded data."""
 
+import functools
 import json
 import os
 import sys
 
 import click
 
+from ..parallel import rule_reference, translate
 from .utils import open_entry_point
 
 
@@ -16,11 +18,21 @@ from .utils import open_entry_point
 @click.argument('rule', callback=open_entry_point('dojson.cli.rule'))
 @click.option('--strict', is_flag=True, default=False,
               help='Raise when there is not matching rule for a key.')
-def process_do(rule, strict):
+@click.option('--snapshot-dir', envvar='DOJSON_SNAPSHOT_DIR',
+              type=click.Path(file_okay=False),
+              help='Directory with snapshots of built rule indexes.')
+def process_do(rule, strict, snapshot_dir):
     """Process data using given rule."""
+    if snapshot_dir:
+        rule.snapshot_dir = snapshot_dir
+
     def processor(iterator):
         for item in iterator:
             yield rule.do(item, ignore_missing=not strict)
+
+    processor.stage = functools.partial(
+        translate, rule_reference(rule), not strict
+    )
     return processor
 
 
@@ -44,23 +56,28 @@ def process_missing(rule):
     return processor
 
 
+def _add_schema(schema, item):
+    """Add $schema to an item."""
+    assert '$schema' not in item
+    item['$schema'] = schema
+    return item
+
+
 @click.command('schema')
 @click.argument('schema')
 def process_schema(schema):
     """Add $schema to an item."""
     def processor(iterator):
         for item in iterator:
-            assert '$schema' not in item
-            item['$schema'] = schema
-            yield item
+            yield _add_schema(schema, item)
 
+    processor.stage = functools.partial(_add_schema, schema)
     return processor
 
 
-@click.command('validate')
-@click.argument('schema')
-def process_validate(schema):
-    """Validate data using given JSON schema."""
+@functools.lru_cache(maxsize=None)
+def _load_validator(schema):
+    """Return validator for a JSON schema file."""
     import jsonschema
 
     def _customize_validator():
@@ -84,17 +101,62 @@ def process_validate(schema):
         'file://' + '/'.join(os.path.split(schema_dir)) + '/', schema_name
     )
     validator_cls = _customize_validator()
-    validator = validator_cls(schema_json, resolver=resolver)
+    return validator_cls(schema_json, resolver=resolver)
+
+
+def _validate(schema, item):
+    """Validate an item using given JSON schema file."""
+    _load_validator(schema).validate(item)
+    return item
+
+
+@click.command('validate')
+@click.argument('schema')
+def process_validate(schema):
+    """Validate data using given JSON schema."""
+    schema = os.path.abspath(schema)
+    validator = _load_validator(schema)
 
     def processor(iterator):
         for item in iterator:
             validator.validate(item)
             yield item
 
+    processor.stage = functools.partial(_validate, schema)
     return processor
 
+
+@click.command('index')
+@click.option('-o', '--output', 'index_path', type=click.Path(dir_okay=False),
+              help='Location of the index, defaults to <input>.idx.')
+def process_index(index_path):
+    """Write index of record offsets in the input file."""
+    params = click.get_current_context().find_root().params
+    path = getattr(params['source'], 'name', None)
+    reader_cls = getattr(params['load'], '__reader__', None)
+    if not isinstance(path, str) or not os.path.isfile(path):
+        raise click.UsageError('Indexing requires an input file (-i).')
+    if reader_cls is None:
+        raise click.UsageError('The loader does not support indexing.')
+
+    def processor(iterator):
+        try:
+            with reader_cls(path, index_path=index_path,
+                            save_index=False) as reader:
+                reader.index.save(reader.index_path)
+                click.echo('Indexed {0} records in {1}'.format(
+                    len(reader), reader.index_path
+                ))
+        except (OSError, ValueError) as exc:
+            raise click.ClickException(str(exc))
+        sys.exit(0)
+
+    return processor
+
+
 __all__ = (
     'process_do',
+    'process_index',
     'process_missing',
     'process_schema',
     'process_validate',
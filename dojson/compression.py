@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Compressed input and output streams.
+
+Input compressed with gzip, bzip2 or xz is recognized by its magic bytes, or
+by the file name extension when the stream cannot be peeked, and is
+decompressed while it is read.
+
+.. code-block:: console
+
+    $ dojson -i records.xml.gz -l marcxml -o records.json.xz do marc21
+
+.. versionadded:: 1.8.0
+"""
+
+import os
+
+# Codec modules are imported on use as Python can be built without them.
+
+
+def _gzip(stream, mode):
+    """Return gzip file object reading or writing a stream."""
+    import gzip
+
+    return gzip.GzipFile(fileobj=stream, mode=mode)
+
+
+def _bz2(stream, mode):
+    """Return bzip2 file object reading or writing a stream."""
+    import bz2
+
+    return bz2.BZ2File(stream, mode)
+
+
+def _xz(stream, mode):
+    """Return xz file object reading or writing a stream."""
+    import lzma
+
+    return lzma.LZMAFile(stream, mode)
+
+
+CODECS = {
+    'gzip': (b'\x1f\x8b', ('.gz', ), _gzip),
+    'bz2': (b'BZh', ('.bz2', ), _bz2),
+    'xz': (b'\xfd7zXZ\x00', ('.xz', ), _xz),
+}
+"""Magic bytes, file name extensions and file object of compressions."""
+
+
+def detect(head=None, name=None):
+    """Return compression of data starting with ``head`` or ``None``.
+
+    The extension of ``name`` is used only when ``head`` is ``None``.
+    """
+    for compression, (magic, extensions, _) in CODECS.items():
+        if head is not None:
+            if head.startswith(magic):
+                return compression
+        elif isinstance(name, str) and \
+                os.path.splitext(name)[1].lower() in extensions:
+            return compression
+    return None
+
+
+def _peek(stream, size=6):
+    """Return first bytes of a stream without consuming them or ``None``."""
+    if hasattr(stream, 'peek'):
+        return stream.peek(size)[:size]
+    if getattr(stream, 'seekable', lambda: False)():
+        position = stream.tell()
+        head = stream.read(size)
+        stream.seek(position)
+        return head
+    return None
+
+
+def open_input(stream):
+    """Return binary file object decompressing a stream if it is compressed.
+
+    Uncompressed streams are returned as they are.
+    """
+    compression = detect(_peek(stream), getattr(stream, 'name', None))
+    if compression is None:
+        return stream
+    return CODECS[compression][2](stream, 'rb')
+
+
+def open_output(stream, compression):
+    """Return binary file object compressing data written to a stream.
+
+    Closing the returned file object finishes the compressed data and
+    leaves the stream open.
+    """
+    return CODECS[compression][2](stream, 'wb')
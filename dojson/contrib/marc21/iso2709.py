@@ -0,0 +1,325 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utilities for reading binary MARC 21 (ISO 2709) records.
+
+Records are returned in the same shape as
+:func:`dojson.contrib.marc21.utils.create_record` produces for MARCXML.
+
+.. code-block:: console
+
+    $ dojson -i records.mrc -l marc do marc21
+
+Field data is decoded as UTF-8 unless another codec is given to
+:func:`load` or set in the ``DOJSON_MARC_ENCODING`` environment variable.
+
+.. versionadded:: 1.8.0
+"""
+
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from dojson.compression import open_input
+from dojson.offsets import IndexedReader, OffsetIndex
+from dojson.utils import GroupableOrderedDict
+
+RECORD_TERMINATOR = b'\x1d'
+"""End of a record."""
+
+FIELD_TERMINATOR = b'\x1e'
+"""End of a variable field and of the directory."""
+
+SUBFIELD_DELIMITER = b'\x1f'
+"""Start of a subfield."""
+
+LEADER_LENGTH = 24
+"""Length of the leader."""
+
+
+def _indicator(value):
+    """Normalize an indicator like MARCXML records do."""
+    if value in ('', '#'):
+        return '_'
+    return value.replace(' ', '_')
+
+
+def _read_directory(data, offset=0):
+    """Return leader and ``(tag, start, end)`` of fields of a record.
+
+    The record starts at ``offset`` of ``data`` which can be bytes or a
+    memory map, field positions are absolute.
+    """
+    leader = data[offset:offset + LEADER_LENGTH].decode('ascii', 'replace')
+    base = offset + int(leader[12:17])
+    directory = data[offset + LEADER_LENGTH:base].rstrip(FIELD_TERMINATOR)
+    fields = []
+    for entry in range(0, len(directory) - 11, 12):
+        start = base + int(directory[entry + 7:entry + 12])
+        fields.append((
+            directory[entry:entry + 3].decode('ascii', 'replace'),
+            start,
+            start + int(directory[entry + 3:entry + 7]),
+        ))
+    return leader, fields
+
+
+def _layout(leader):
+    """Return indicator count and subfield code length from a leader."""
+    return (
+        int(leader[10]) if leader[10].isdigit() else 2,
+        int(leader[11]) - 1 if leader[11].isdigit() else 1,
+    )
+
+
+def _datafield_key(tag, head, indicators):
+    """Return key of a data field from its tag and decoded indicators."""
+    return '{0}{1}{2}'.format(
+        tag,
+        _indicator(head[0:1] if indicators > 0 else ''),
+        _indicator(head[1:2] if indicators > 1 else ''),
+    )
+
+
+def _subfields(field, code_length, encoding, errors, keep_singletons):
+    """Return ``(code, text)`` pairs of data field bytes."""
+    fields = []
+    for subfield in field.split(SUBFIELD_DELIMITER)[1:]:
+        code = subfield[:code_length].decode(encoding, errors).lower()
+        text = subfield[code_length:].decode(encoding, errors)
+        if text or keep_singletons:
+            fields.append((code, text))
+    return fields
+
+
+def create_record(data, encoding='utf-8', errors='strict',
+                  keep_singletons=True):
+    """Create a record object from one ISO 2709 record.
+
+    The leader and the directory are read by slicing the bytes and only
+    field data is decoded.
+
+    :param data: bytes of the record with or without the record terminator.
+    :param encoding: codec of the field data.
+    :param errors: error handling of the codec.
+    :param keep_singletons: keep fields and subfields without data.
+    """
+    leader, directory = _read_directory(data)
+    indicators, code_length = _layout(leader)
+
+    controlfields = []
+    datafields = []
+    for tag, start, end in directory:
+        field = data[start:end].rstrip(FIELD_TERMINATOR)
+
+        if tag.startswith('00'):
+            text = field.decode(encoding, errors)
+            if text or keep_singletons:
+                controlfields.append((tag, text))
+            continue
+
+        key = _datafield_key(
+            tag, field[:indicators].decode(encoding, errors), indicators
+        )
+        fields = _subfields(
+            field, code_length, encoding, errors, keep_singletons
+        )
+        if fields or keep_singletons:
+            datafields.append((key, GroupableOrderedDict(fields)))
+
+    return GroupableOrderedDict(
+        [('leader', leader)] + controlfields + datafields
+    )
+
+
+class LazyRecord(Mapping):
+    """ISO 2709 record decoding field data only when it is accessed.
+
+    The leader and the directory are parsed when the record is created and
+    the record behaves like the :class:`~dojson.utils.GroupableOrderedDict`
+    returned by :func:`create_record`, so it can be passed directly to
+    :meth:`dojson.overdo.Overdo.do`.  The data has to stay readable, e.g.
+    the :class:`Reader` open, while the record is used.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, data, offset=0, encoding='utf-8', errors='strict'):
+        """Parse the directory of a record starting at ``offset``."""
+        self._data = data
+        self.encoding = encoding
+        self.errors = errors
+        self.leader, directory = _read_directory(data, offset)
+        self._layout = _layout(self.leader)
+        # Control fields go first like in records from MARCXML.
+        self._fields = [field for field in directory
+                        if field[0].startswith('00')]
+        self._fields.extend(field for field in directory
+                            if not field[0].startswith('00'))
+        self._order = None
+
+    @property
+    def order(self):
+        """Return keys of all fields starting with the leader."""
+        if self._order is None:
+            indicators = self._layout[0]
+            order = ['leader']
+            for tag, start, end in self._fields:
+                if not tag.startswith('00'):
+                    head = self._data[start:min(start + indicators, end)]
+                    tag = _datafield_key(
+                        tag, head.decode(self.encoding, self.errors),
+                        indicators,
+                    )
+                order.append(tag)
+            self._order = tuple(order)
+        return self._order
+
+    def _value(self, number):
+        """Decode value of the field at a position of the order."""
+        if number == 0:
+            return self.leader
+        tag, start, end = self._fields[number - 1]
+        field = self._data[start:end].rstrip(FIELD_TERMINATOR)
+        if tag.startswith('00'):
+            return field.decode(self.encoding, self.errors)
+        return GroupableOrderedDict(_subfields(
+            field, self._layout[1], self.encoding, self.errors, True
+        ))
+
+    def __getitem__(self, key):
+        """Return value of a field or tuple of values of repeated fields."""
+        if key == '__order__':
+            return self.order
+        values = [self._value(number)
+                  for number, name in enumerate(self.order) if name == key]
+        if not values:
+            raise KeyError(key)
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def __iter__(self):
+        """Iterate over ``__order__`` and unique keys."""
+        yield '__order__'
+        for key in OrderedDict.fromkeys(self.order):
+            yield key
+
+    def __len__(self):
+        """Return number of unique keys including ``__order__``."""
+        return len(set(self.order)) + 1
+
+    def iteritems(self, with_order=True, repeated=False):
+        """Iterate over items like :class:`~dojson.utils.GroupableOrderedDict`."""
+        if with_order:
+            yield '__order__', self.order
+        if repeated:
+            for number, key in enumerate(self.order):
+                yield key, self._value(number)
+        else:
+            for key in OrderedDict.fromkeys(self.order):
+                yield key, self[key]
+
+    def decode(self):
+        """Return record with all fields decoded."""
+        return GroupableOrderedDict(
+            list(self.iteritems(with_order=False, repeated=True))
+        )
+
+
+def build_index(data, stat=None, encoding='utf-8', errors='strict'):
+    """Return :class:`~dojson.offsets.OffsetIndex` of records by ``001``.
+
+    .. versionadded:: 1.8.0
+    """
+    index = OffsetIndex(stat=stat)
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(RECORD_TERMINATOR, start)
+        end = size if end == -1 else end + 1
+        while start < end and data[start:start + 1].isspace():
+            start += 1
+        if start < end and data[start:end].strip():
+            control_number = None
+            for tag, field_start, field_end in _read_directory(data, start)[1]:
+                if tag == '001':
+                    control_number = data[field_start:field_end].rstrip(
+                        FIELD_TERMINATOR
+                    ).decode(encoding, errors).strip()
+                    break
+            index.append(start, end, control_number)
+        start = end
+    return index
+
+
+class Reader(IndexedReader):
+    """Random access to records of an ISO 2709 file.
+
+    The file is memory mapped and records are found by number or by ``001``
+    control number using an :class:`~dojson.offsets.OffsetIndex`.  The
+    index is built on first use and saved next to the file.  Records are
+    :class:`LazyRecord` instances valid until the reader is closed.
+
+    .. code-block:: python
+
+        with Reader('records.mrc') as reader:
+            record = marc21.do(reader.get('123456'))
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, path, encoding=None, errors='strict', **kwargs):
+        """Open the file, see :class:`~dojson.offsets.IndexedReader`.
+
+        :param encoding: see :func:`load`.
+        """
+        self.encoding = encoding or os.environ.get(
+            'DOJSON_MARC_ENCODING', 'utf-8'
+        )
+        self.errors = errors
+        super(Reader, self).__init__(path, **kwargs)
+
+    def build_index(self, stat):
+        """Return index of records by ``001``."""
+        return build_index(self._data, stat, self.encoding, self.errors)
+
+    def parse(self, start, end):
+        """Return lazy record starting at ``start``."""
+        return LazyRecord(self._data, start, self.encoding, self.errors)
+
+
+def split_stream(stream, chunk_size=65536):
+    """Yield bytes of records read in chunks from a binary stream."""
+    rest = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (rest + chunk).split(RECORD_TERMINATOR)
+        rest = records.pop()
+        for record in records:
+            # Some exports separate records with line breaks.
+            record = record.lstrip()
+            if record:
+                yield record
+
+    rest = rest.strip()
+    if rest:
+        yield rest
+
+
+def load(source, encoding=None, errors='strict', keep_singletons=True):
+    """Load ISO 2709 records from a binary stream and yield Python dicts.
+
+    :param source: binary file object, compressed data is decompressed.
+    :param encoding: codec of the field data, defaults to the value of the
+                     ``DOJSON_MARC_ENCODING`` environment variable or UTF-8.
+    """
+    encoding = encoding or os.environ.get('DOJSON_MARC_ENCODING', 'utf-8')
+    for data in split_stream(open_input(source)):
+        yield create_record(
+            data, encoding=encoding, errors=errors,
+            keep_singletons=keep_singletons,
+        )
+
+
+load.__reader__ = Reader
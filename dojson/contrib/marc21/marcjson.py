@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utilities for reading MARC-in-JSON records.
+
+Records in the MARC-in-JSON structure
+
+.. code-block:: json
+
+    {"leader": "00000nam a2200000 a 4500",
+     "fields": [{"001": "123"},
+                {"245": {"ind1": "1", "ind2": "0",
+                         "subfields": [{"a": "Title"}]}}]}
+
+are returned in the same shape as
+:func:`dojson.contrib.marc21.utils.create_record` produces for MARCXML.
+
+.. code-block:: console
+
+    $ dojson -i records.json -l marcjson do marc21
+
+.. versionadded:: 1.8.0
+"""
+
+from dojson._compat import iteritems, string_types
+from dojson.compression import open_input
+from dojson.utils import GroupableOrderedDict, iter_json
+
+from .iso2709 import _indicator
+
+
+def create_record(data, keep_singletons=True):
+    """Create a record object from a MARC-in-JSON record.
+
+    :param data: decoded MARC-in-JSON record.
+    :param keep_singletons: keep fields and subfields without data.
+    """
+    leaders = []
+    if data.get('leader') is not None:
+        leaders.append(('leader', data['leader']))
+
+    controlfields = []
+    datafields = []
+    for field in data.get('fields', ()):
+        for tag, value in iteritems(field):
+            if isinstance(value, string_types):
+                if value or keep_singletons:
+                    controlfields.append((tag, value))
+                continue
+
+            fields = []
+            for subfield in value.get('subfields', ()):
+                for code, text in iteritems(subfield):
+                    if text or keep_singletons:
+                        fields.append((code.lower(), text))
+
+            if fields or keep_singletons:
+                key = '{0}{1}{2}'.format(
+                    tag,
+                    _indicator(value.get('ind1', ' ')),
+                    _indicator(value.get('ind2', ' ')),
+                )
+                datafields.append((key, GroupableOrderedDict(fields)))
+
+    return GroupableOrderedDict(leaders + controlfields + datafields)
+
+
+def load(source, keep_singletons=True):
+    """Load MARC-in-JSON records from a bytestream and yield Python dicts.
+
+    The stream can contain a single record, an array of records or records
+    separated by new lines, records are decoded one at a time.  Compressed
+    streams are decompressed.
+    """
+    for data in iter_json(open_input(source)):
+        yield create_record(data, keep_singletons=keep_singletons)
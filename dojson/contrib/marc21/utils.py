@@ -3,98 +3,304 @@
 
 """Utilities for converting MARC21."""
 
+import functools
 import importlib.resources
+import itertools
+import mmap
+import os
 import re
+import threading
 from collections import Counter, OrderedDict
+from xml.sax.saxutils import unescape
 
 from lxml import etree
 
-from dojson._compat import StringIO, binary_type, iteritems, text_type
+from dojson._compat import BytesIO, binary_type, iteritems, text_type
+from dojson.compression import open_input
+from dojson.offsets import IndexedReader, OffsetIndex
+from dojson.parallel import Executor, chain
 from dojson.utils import GroupableOrderedDict
 
 split_marc = re.compile('<record.*?>.*?</record>', re.DOTALL)
 
+_RECORD_START = re.compile(rb'<(?:[\w.-]+:)?record(?=[\s/>])')
+_RECORD_END = re.compile(rb'</(?:[\w.-]+:)?record\s*>')
+_CONTROL_NUMBER = re.compile(
+    rb'<(?:[\w.-]+:)?controlfield\s[^>]*?tag\s*=\s*["\']001["\'][^>]*>'
+    rb'([^<]*)<'
+)
+_NAMESPACE = re.compile(rb'\sxmlns(?::[\w.-]+)?\s*=\s*("[^"]*"|\'[^\']*\')')
+
 
 MARC21_DTD = importlib.resources.files('dojson.contrib.marc21') / 'MARC21slim.dtd'
 """Location of the MARC21 DTD file"""
 
 
+_FIELDS = ('{*}leader', '{*}controlfield', '{*}datafield')
+
+_parsers = threading.local()
+
+
+def _parser():
+    """Return recovering parser reused by the current thread."""
+    parser = getattr(_parsers, 'parser', None)
+    if parser is None:
+        parser = _parsers.parser = etree.XMLParser(recover=True)
+    return parser
+
+
 def create_record(marcxml, correct=False, keep_singletons=True):
     """Create a record object using the LXML parser.
 
     If correct == 1, then perform DTD validation
     If correct == 0, then do not perform DTD validation
+
+    .. versionchanged:: 1.8.0
+       Fields are collected in a single pass over the tree and strings are
+       parsed by a parser reused across records.
     """
-    if isinstance(marcxml, binary_type):
+    if isinstance(marcxml, binary_type) and correct:
         marcxml = marcxml.decode('utf-8')
 
-    if isinstance(marcxml, text_type):
-        parser = etree.XMLParser(dtd_validation=correct, recover=True)
-
-        if correct:
-            marcxml = (u'<?xml version="1.0" encoding="UTF-8"?>\n'
-                       u'<!DOCTYPE collection SYSTEM "file://{0}">\n'
-                       u'<collection>\n{1}\n</collection>'.format(
-                           MARC21_DTD, marcxml))
-
-        tree = etree.parse(StringIO(marcxml), parser)
+    if isinstance(marcxml, (binary_type, text_type)) and not correct:
+        # Decoded text is parsed as text, encoding declarations are refused.
+        tree = etree.fromstring(marcxml, _parser())
+        if tree is None:
+            return GroupableOrderedDict(())
+    elif isinstance(marcxml, text_type):
+        parser = etree.XMLParser(dtd_validation=True, recover=True)
+        marcxml = (u'<?xml version="1.0" encoding="UTF-8"?>\n'
+                   u'<!DOCTYPE collection SYSTEM "file://{0}">\n'
+                   u'<collection>\n{1}\n</collection>'.format(
+                       MARC21_DTD, marcxml))
+        tree = etree.parse(BytesIO(marcxml.encode('utf-8')), parser)
     else:
         tree = marcxml
-    record = []
-
-    leader_iterator = tree.iter(tag='{*}leader')
-    for leader in leader_iterator:
-        text = leader.text or ''
-        record.append(('leader', text))
-
-    controlfield_iterator = tree.iter(tag='{*}controlfield')
-    for controlfield in controlfield_iterator:
-        tag = controlfield.attrib.get('tag', '!')
-        text = controlfield.text or ''
-        if text or keep_singletons:
-            record.append((tag, text))
-
-    datafield_iterator = tree.iter(tag='{*}datafield')
-    for datafield in datafield_iterator:
-        tag = datafield.attrib.get('tag', '!')
-        ind1 = datafield.attrib.get('ind1', '!')
-        ind2 = datafield.attrib.get('ind2', '!')
-        if ind1 in ('', '#'):
-            ind1 = '_'
-        if ind2 in ('', '#'):
-            ind2 = '_'
-        ind1 = ind1.replace(' ', '_')
-        ind2 = ind2.replace(' ', '_')
-
-        fields = []
-        subfield_iterator = datafield.iter(tag='{*}subfield')
-        for subfield in subfield_iterator:
-            code = subfield.attrib.get('code', '!').lower()  # .encode("UTF-8")
-            text = subfield.text or ''
+
+    leaders = []
+    controlfields = []
+    datafields = []
+
+    for field in tree.iter(_FIELDS):
+        tag = field.tag
+        name = tag[tag.rfind('}') + 1:]
+
+        if name == 'leader':
+            leaders.append(('leader', field.text or ''))
+
+        elif name == 'controlfield':
+            text = field.text or ''
             if text or keep_singletons:
-                fields.append((code, text))
+                controlfields.append((field.get('tag', '!'), text))
+
+        else:
+            ind1 = field.get('ind1', '!')
+            ind2 = field.get('ind2', '!')
+            if ind1 in ('', '#'):
+                ind1 = '_'
+            if ind2 in ('', '#'):
+                ind2 = '_'
+            ind1 = ind1.replace(' ', '_')
+            ind2 = ind2.replace(' ', '_')
+
+            fields = []
+            for subfield in field.iter(tag='{*}subfield'):
+                code = subfield.get('code', '!').lower()
+                text = subfield.text or ''
+                if text or keep_singletons:
+                    fields.append((code, text))
 
-        if fields or keep_singletons:
-            key = '{0}{1}{2}'.format(tag, ind1, ind2)
-            record.append((key, GroupableOrderedDict(fields)))
+            if fields or keep_singletons:
+                key = '{0}{1}{2}'.format(field.get('tag', '!'), ind1, ind2)
+                datafields.append((key, GroupableOrderedDict(fields)))
 
-    return GroupableOrderedDict(record)
+    return GroupableOrderedDict(leaders + controlfields + datafields)
 
 
 def split_blob(blob):
     """Split the blob using <record.*?>.*?</record> as pattern."""
     for match in split_marc.finditer(blob):
         yield match.group()
-    raise StopIteration()
 
 
-def split_stream(stream):
-    """Yield record elements from given stream."""
+def split_stream(stream, clear=False):
+    """Yield record elements from given stream.
+
+    If ``clear`` is set, each record element and the elements before it are
+    removed from the parsed tree once the next record is requested, so
+    memory usage does not grow with the size of the stream.  Yielded
+    elements must then be used before requesting the next one.
+
+    .. versionchanged:: 1.8.0
+       Added ``clear``.
+    """
     for _, element in etree.iterparse(stream, tag='{*}record'):
         yield element
+        if clear:
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+def split_buffer(buffer, start=0):
+    """Yield ``(start, end)`` byte offsets of records in a buffer.
+
+    The buffer can be any object supporting the buffer protocol such as
+    ``mmap.mmap``, it is searched without being copied.
+
+    .. versionadded:: 1.8.0
+    """
+    while True:
+        match = _RECORD_START.search(buffer, start)
+        if match is None:
+            return
+        end = _RECORD_END.search(buffer, match.end())
+        if end is None:
+            return
+        start = end.end()
+        yield match.start(), start
+
+
+_buffers = {}
+"""Memory maps of files opened by :func:`_load_range` in this process."""
+
+
+def _namespaces(buffer, end):
+    """Return namespace declarations found before ``end`` of a buffer."""
+    return b''.join(
+        match.group() for match in _NAMESPACE.finditer(buffer, 0, end)
+    )
+
+
+def _create_range(buffer, namespaces, keep_singletons, start, end):
+    """Create record from a byte range of a buffer."""
+    marcxml = buffer[start:end]
+    if namespaces:
+        # Keep prefixes declared on the collection element bound.
+        marcxml = b''.join((b'<collection', namespaces, b'>', marcxml,
+                            b'</collection>'))
+    return create_record(marcxml, keep_singletons=keep_singletons)
+
 
+def _load_range(path, namespaces, keep_singletons, offsets):
+    """Create record from a byte range of a memory mapped file."""
+    buffer = _buffers.get(path)
+    if buffer is None:
+        with open(path, 'rb') as stream:
+            buffer = _buffers[path] = mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ
+            )
+    return _create_range(buffer, namespaces, keep_singletons, *offsets)
 
-def load(source):
-    """Load MARC XML and return Python dict."""
-    for data in split_stream(source):
+
+def load_parallel(path, jobs=None, keep_singletons=True, stages=(),
+                  **kwargs):
+    """Load MARC XML file using worker processes.
+
+    The file is memory mapped and searched for record boundaries, only byte
+    offsets are sent to worker processes which create the records.  Records
+    are yielded in the order of the file.
+
+    :param path: path of the MARC XML file.
+    :param jobs: number of worker processes.
+    :param stages: picklable functions applied one after another to every
+                   record by the worker processes, e.g. translation, so
+                   that only their results are sent back.
+    :param kwargs: other arguments of :class:`dojson.parallel.Executor`.
+
+    .. versionadded:: 1.8.0
+    """
+    path = os.path.abspath(path)
+    if not os.path.getsize(path):
+        return
+
+    with open(path, 'rb') as stream:
+        buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        ranges = split_buffer(buffer)
+        first = next(ranges, None)
+        if first is None:
+            return
+
+        namespaces = _namespaces(buffer, first[0])
+        function = functools.partial(
+            _load_range, path, namespaces, keep_singletons
+        )
+        if stages:
+            function = functools.partial(chain, [function] + list(stages))
+        with Executor(jobs=jobs, **kwargs) as executor:
+            yield from executor.map(
+                function, itertools.chain((first, ), ranges)
+            )
+    finally:
+        buffer.close()
+
+
+def build_index(buffer, stat=None):
+    """Return :class:`~dojson.offsets.OffsetIndex` of records by ``001``.
+
+    .. versionadded:: 1.8.0
+    """
+    index = OffsetIndex(stat=stat)
+    for start, end in split_buffer(buffer):
+        match = _CONTROL_NUMBER.search(buffer, start, end)
+        control_number = None
+        if match is not None:
+            control_number = unescape(
+                match.group(1).decode('utf-8').strip()
+            )
+        index.append(start, end, control_number)
+    return index
+
+
+class Reader(IndexedReader):
+    """Random access to records of a MARC XML file.
+
+    Records are found by number or by ``001`` control number using an
+    :class:`~dojson.offsets.OffsetIndex` built on first use and saved next
+    to the file.  Only the requested records are parsed.
+
+    .. code-block:: python
+
+        with Reader('records.xml') as reader:
+            records = reader[100:200]
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, path, keep_singletons=True, **kwargs):
+        """Open the file, see :class:`~dojson.offsets.IndexedReader`."""
+        self.keep_singletons = keep_singletons
+        super(Reader, self).__init__(path, **kwargs)
+        self._namespaces = b''
+        if len(self.index):
+            self._namespaces = _namespaces(self._data, self.index[0][0])
+
+    def build_index(self, stat):
+        """Return index of records by ``001``."""
+        return build_index(self._data, stat)
+
+    def parse(self, start, end):
+        """Create record from a byte range."""
+        return _create_range(
+            self._data, self._namespaces, self.keep_singletons, start, end
+        )
+
+
+def load(source, clear=True):
+    """Load MARC XML and return Python dict.
+
+    Parsed records are removed from the tree unless ``clear`` is ``False``,
+    see :func:`split_stream`.
+
+    .. versionchanged:: 1.8.0
+       Added ``clear``, and compressed streams are decompressed.
+    """
+    for data in split_stream(open_input(source), clear=clear):
         yield create_record(data)
+
+
+load.__parallel__ = load_parallel
+load.__reader__ = Reader
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utilities for writing binary MARC 21 (ISO 2709) records.
+
+.. code-block:: console
+
+    $ dojson -i records.json -d marc do to_marc21 > records.mrc
+
+.. versionadded:: 1.8.0
+"""
+
+from dojson.contrib.marc21.iso2709 import (
+    FIELD_TERMINATOR,
+    LEADER_LENGTH,
+    RECORD_TERMINATOR,
+    SUBFIELD_DELIMITER,
+)
+
+from .records import iter_fields
+
+DEFAULT_LEADER = '     nam a22     uu 4500'
+"""Leader used for records without one."""
+
+
+def dump_record(record, encoding='utf-8'):
+    """Dump a single record into ISO 2709 bytes.
+
+    The directory and the field data are built in one pass over the fields,
+    the record length and the base address of data are then set in the
+    leader.
+    """
+    directory = []
+    data = []
+    position = 0
+    for tag, indicators, value in iter_fields(record):
+        if indicators is None:
+            field = value.encode(encoding)
+        else:
+            parts = [''.join(indicators).encode(encoding)]
+            for code, text in value:
+                if code is not None:
+                    parts.append(SUBFIELD_DELIMITER + code.encode(encoding))
+                parts.append(text.encode(encoding))
+            field = b''.join(parts)
+        field += FIELD_TERMINATOR
+
+        if len(field) > 9999:
+            raise ValueError('Field {0} is too long.'.format(tag))
+        directory.append(
+            '{0}{1:04d}{2:05d}'.format(tag, len(field), position)
+            .encode('ascii')
+        )
+        data.append(field)
+        position += len(field)
+
+    base = LEADER_LENGTH + 12 * len(directory) + 1
+    length = base + position + 1
+    if length > 99999:
+        raise ValueError('Record is too long.')
+
+    leader = (record.get('leader') or DEFAULT_LEADER).ljust(LEADER_LENGTH)
+    leader = '{0:05d}{1}{2}22{3:05d}{4}4500'.format(
+        length,
+        leader[5:9],
+        'a' if encoding.replace('-', '').lower() == 'utf8' else leader[9],
+        base,
+        leader[17:20],
+    )
+    return b''.join([leader.encode('ascii')] + directory + [
+        FIELD_TERMINATOR
+    ] + data + [RECORD_TERMINATOR])
+
+
+def dumps(records, encoding='utf-8'):
+    """Dump records into ISO 2709 bytes."""
+    if isinstance(records, dict):
+        return dump_record(records, encoding=encoding)
+    return b''.join(dump_record(record, encoding) for record in records)
+
+
+def dump_stream(records, stream, encoding='utf-8'):
+    """Write records into a binary file object one record at a time."""
+    if isinstance(records, dict):
+        records = (records, )
+    for record in records:
+        stream.write(dump_record(record, encoding=encoding))
+
+
+dumps.__stream__ = dump_stream
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utilities for writing MARC-in-JSON records.
+
+.. code-block:: console
+
+    $ dojson -i records.json -d marcjson do to_marc21
+
+.. versionadded:: 1.8.0
+"""
+
+import simplejson as json
+
+from .records import iter_fields
+
+
+def dump_record(record):
+    """Convert a single record into a MARC-in-JSON dict."""
+    fields = []
+    for tag, indicators, value in iter_fields(record):
+        if indicators is None:
+            fields.append({tag: value})
+            continue
+        fields.append({tag: {
+            'ind1': indicators[0],
+            'ind2': indicators[1],
+            'subfields': [{code or '': text} for code, text in value],
+        }})
+
+    data = {}
+    leader = record.get('leader')
+    if leader:
+        data['leader'] = leader
+    data['fields'] = fields
+    return data
+
+
+def dumps(records):
+    """Dump records into a MARC-in-JSON string.
+
+    A single record is dumped as an object, other records as an array.
+    """
+    if isinstance(records, dict):
+        return json.dumps(dump_record(records))
+    return json.dumps([dump_record(record) for record in records])
+
+
+def dump_stream(records, stream):
+    """Write records into a binary file object one record at a time.
+
+    The output is the same as from :func:`dumps` followed by a new line.
+    """
+    if isinstance(records, dict):
+        stream.write(dumps(records).encode('utf-8') + b'\n')
+        return
+
+    stream.write(b'[')
+    for position, record in enumerate(records):
+        if position:
+            stream.write(b', ')
+        stream.write(json.dumps(dump_record(record)).encode('utf-8'))
+    stream.write(b']\n')
+
+
+dumps.__stream__ = dump_stream
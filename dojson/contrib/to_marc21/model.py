@@ -9,7 +9,13 @@ from operator import itemgetter
 from dojson import Overdo
 from dojson._compat import iteritems
 from dojson.errors import IgnoreKey, MissingRule
-from dojson.utils import GroupableOrderedDict
+from dojson.utils import IGNORE_KEY, GroupableOrderedDict
+
+_HANDLERS = {
+    False: {IgnoreKey: None},
+    True: {IgnoreKey: None, MissingRule: None},
+}
+"""Default exception handlers indexed by ``ignore_missing``."""
 
 
 class Underdo(Overdo):
@@ -40,58 +46,67 @@ class Underdo(Overdo):
            ``exception_handlers`` allows unknown keys to treated in a custom
            fashion.
         """
-        handlers = {IgnoreKey: None}
-        handlers.update(exception_handlers or {})
+        handlers = self._handlers(ignore_missing, exception_handlers)
+        self._build_for(blob)
+        return self._do(blob, handlers)
 
+    def _handlers(self, ignore_missing, exception_handlers):
+        """Return exception handlers for given options."""
+        if exception_handlers is None:
+            return _HANDLERS[bool(ignore_missing)]
+
+        handlers = {IgnoreKey: None}
+        handlers.update(exception_handlers)
         if ignore_missing:
             handlers.setdefault(MissingRule, None)
+        return handlers
 
+    def _do(self, blob, handlers):
+        """Translate blob values using prepared exception handlers."""
         output = []
 
-        if self.index is None:
-            self.build()
-
         if '__order__' in blob and not isinstance(blob, GroupableOrderedDict):
             blob = GroupableOrderedDict(blob)
 
         if '__order__' in blob:
+            keys = ('__order__',) + blob['__order__']
             items = blob.iteritems(repeated=True)
         else:
+            keys = tuple(blob)
             items = iteritems(blob)
 
-        for key, value in items:
-            try:
-                result = self.index.query(key)
-                if not result:
-                    raise MissingRule(key)
+        for (key, value), step in zip(items, self.plan(keys)):
+            if step is None:
+                self._handle(MissingRule(key), handlers, output, key, value)
+                continue
 
-                name, creator = result
+            name, creator, _ = step
+            try:
                 item = creator(output, key, value)
-                if isinstance(item, MutableMapping):
-                    field = '{0}{1}{2}'.format(
-                        name, item.pop('$ind1', '_'),
-                        item.pop('$ind2', '_'))
-                    if '__order__' in item:
-                        item = GroupableOrderedDict(item)
-                    output.append((field, item))
-                elif isinstance(item, MutableSequence):
-                    for v in item:
-                        try:
-                            field = '{0}{1}{2}'.format(
-                                name, v.pop('$ind1', '_'),
-                                v.pop('$ind2', '_'))
-                        except AttributeError:
-                            field = name
-                        output.append((field, v))
-                else:
-                    output.append((name, item))
+                if item is not IGNORE_KEY:
+                    if isinstance(item, MutableMapping):
+                        field = '{0}{1}{2}'.format(
+                            name, item.pop('$ind1', '_'),
+                            item.pop('$ind2', '_'))
+                        if '__order__' in item:
+                            item = GroupableOrderedDict(item)
+                        output.append((field, item))
+                    elif isinstance(item, MutableSequence):
+                        for v in item:
+                            try:
+                                field = '{0}{1}{2}'.format(
+                                    name, v.pop('$ind1', '_'),
+                                    v.pop('$ind2', '_'))
+                            except AttributeError:
+                                field = name
+                            output.append((field, v))
+                    else:
+                        output.append((name, item))
+                    continue
             except Exception as exc:
-                if exc.__class__ in handlers:
-                    handler = handlers[exc.__class__]
-                    if handler is not None:
-                        handler(exc, output, key, value)
-                else:
-                    raise
+                self._handle(exc, handlers, output, key, value)
+                continue
+            self._handle(IgnoreKey(key), handlers, output, key, value)
 
         return GroupableOrderedDict(output)
 
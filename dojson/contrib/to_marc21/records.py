@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Serialization independent utilities for MARC 21 records.
+
+.. versionadded:: 1.8.0
+"""
+
+from dojson._compat import iteritems, string_types
+from dojson.utils import GroupableOrderedDict
+
+
+def iter_fields(record):
+    """Yield control and data fields of a record in MARC 21 order.
+
+    Control fields are yielded as ``(tag, None, value)`` and data fields as
+    ``(tag, (ind1, ind2), subfields)`` where ``subfields`` is a list of
+    ``(code, value)`` pairs.  Blank indicators are spaces and the code is
+    ``None`` for values given without a subfield code.  The leader is
+    skipped.
+
+    .. versionadded:: 1.8.0
+    """
+    if isinstance(record, GroupableOrderedDict):
+        items = record.iteritems(with_order=False, repeated=True)
+    else:
+        items = iteritems(record)
+
+    for df, subfields in items:
+        # Control fields
+        if len(df) == 3:
+            if isinstance(subfields, string_types):
+                yield df, None, subfields
+            elif isinstance(subfields, (list, tuple, set)):
+                for subfield in subfields:
+                    yield df, None, subfield
+        else:
+            # Skip leader.
+            if df == 'leader':
+                continue
+
+            if not isinstance(subfields, (list, tuple, set)):
+                subfields = (subfields,)
+
+            df = df.replace('_', ' ')
+            for subfield in subfields:
+                if not isinstance(subfield, (list, tuple, set)):
+                    subfield = [subfield]
+
+                for s in subfield:
+                    if isinstance(s, GroupableOrderedDict):
+                        items = s.iteritems(with_order=False, repeated=True)
+                    elif isinstance(s, dict):
+                        items = iteritems(s)
+                    else:
+                        yield df[0:3], (df[3], df[4]), [(None, s)]
+                        continue
+
+                    values = []
+                    for code, value in items:
+                        if not isinstance(value, string_types):
+                            for v in value:
+                                values.append((code, v))
+                        else:
+                            values.append((code, value))
+
+                    yield df[0:3], (df[3], df[4]), values
@@ -8,89 +8,52 @@ import importlib.resources
 from lxml import etree
 from lxml.builder import ElementMaker
 
-from dojson._compat import iteritems, string_types
-from dojson.utils import GroupableOrderedDict
+from .marcxml import MARC21_NS
+from .records import iter_fields
 
 MARC21_DTD = importlib.resources.files('dojson.contrib.marc21') / 'MARC21slim.dtd'
 """Location of the MARC21 DTD file"""
 
-MARC21_NS = "http://www.loc.gov/MARC21/slim"
-"""MARCXML XML Schema"""
+
+def _dump_record(E, record):
+    """Dump a single record."""
+    rec = E.record()
+
+    leader = record.get('leader')
+    if leader:
+        rec.append(E.leader(leader))
+
+    for tag, indicators, value in iter_fields(record):
+        if indicators is None:
+            controlfield = E.controlfield(value)
+            controlfield.attrib['tag'] = tag
+            rec.append(controlfield)
+            continue
+
+        datafield = E.datafield()
+        datafield.attrib['tag'] = tag
+        datafield.attrib['ind1'] = indicators[0]
+        datafield.attrib['ind2'] = indicators[1]
+        for code, text in value:
+            if code is None:
+                datafield.append(E.subfield(text))
+            else:
+                datafield.append(E.subfield(text, code=code))
+        rec.append(datafield)
+
+    return rec
 
 
 def dumps_etree(records, xslt_filename=None, prefix=None):
     """Dump records into a etree."""
     E = ElementMaker(namespace=MARC21_NS, nsmap={prefix: MARC21_NS})
 
-    def dump_record(record):
-        """Dump a single record."""
-        rec = E.record()
-
-        leader = record.get('leader')
-        if leader:
-            rec.append(E.leader(leader))
-
-        if isinstance(record, GroupableOrderedDict):
-            items = record.iteritems(with_order=False, repeated=True)
-        else:
-            items = iteritems(record)
-
-        for df, subfields in items:
-            # Control fields
-            if len(df) == 3:
-                if isinstance(subfields, string_types):
-                    controlfield = E.controlfield(subfields)
-                    controlfield.attrib['tag'] = df[0:3]
-                    rec.append(controlfield)
-                elif isinstance(subfields, (list, tuple, set)):
-                    for subfield in subfields:
-                        controlfield = E.controlfield(subfield)
-                        controlfield.attrib['tag'] = df[0:3]
-                        rec.append(controlfield)
-            else:
-                # Skip leader.
-                if df == 'leader':
-                    continue
-
-                if not isinstance(subfields, (list, tuple, set)):
-                    subfields = (subfields,)
-
-                df = df.replace('_', ' ')
-                for subfield in subfields:
-                    if not isinstance(subfield, (list, tuple, set)):
-                        subfield = [subfield]
-
-                    for s in subfield:
-                        datafield = E.datafield()
-                        datafield.attrib['tag'] = df[0:3]
-                        datafield.attrib['ind1'] = df[3]
-                        datafield.attrib['ind2'] = df[4]
-
-                        if isinstance(s, GroupableOrderedDict):
-                            items = s.iteritems(with_order=False, repeated=True)
-                        elif isinstance(s, dict):
-                            items = iteritems(s)
-                        else:
-                            datafield.append(E.subfield(s))
-
-                            items = tuple()
-
-                        for code, value in items:
-                            if not isinstance(value, string_types):
-                                for v in value:
-                                    datafield.append(E.subfield(v, code=code))
-                            else:
-                                datafield.append(E.subfield(value, code=code))
-
-                        rec.append(datafield)
-        return rec
-
     if isinstance(records, dict):
-        root = dump_record(records)
+        root = _dump_record(E, records)
     else:
         root = E.collection()
         for record in records:
-            root.append(dump_record(record))
+            root.append(_dump_record(E, record))
 
     if xslt_filename is not None:
         xslt_root = etree.parse(open(xslt_filename))
@@ -100,13 +63,107 @@ def dumps_etree(records, xslt_filename=None, prefix=None):
     return root
 
 
-def dumps(records, xslt_filename=None, **kwargs):
-    """Dump records into a MarcXML file."""
+def dumps(records, xslt_filename=None, pretty_print=True, **kwargs):
+    """Dump records into a MarcXML file.
+
+    .. versionchanged:: 1.8.0
+       Added ``pretty_print``.
+    """
     root = dumps_etree(records=records, xslt_filename=xslt_filename)
     return etree.tostring(
         root,
-        pretty_print=True,
+        pretty_print=pretty_print,
         xml_declaration=True,
         encoding='UTF-8',
         **kwargs
     )
+
+
+class MARCXMLWriter(object):
+    """Write records into a MarcXML collection one record at a time.
+
+    The XML declaration and the collection start are written with the first
+    record or when the writer is closed, each record is serialized and
+    written as soon as it is given.  The output is the same as from
+    :func:`dumps` and the stream can be any binary file object, e.g. a
+    :class:`gzip.GzipFile`.
+
+    .. code-block:: python
+
+        with MARCXMLWriter(stream) as writer:
+            for record in records:
+                writer.write(to_marc21.do(record))
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, stream, pretty_print=True):
+        """Initialize the writer, nothing is written yet."""
+        self.stream = stream
+        self.pretty_print = pretty_print
+        self.count = 0
+        self.closed = False
+        # The collection declares the default namespace for all records.
+        self._maker = ElementMaker()
+
+    def _start(self):
+        """Write the XML declaration and the collection start."""
+        self.stream.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+        self.stream.write(
+            '<collection xmlns="{0}"'.format(MARC21_NS).encode('utf-8')
+        )
+
+    def write(self, record):
+        """Serialize and write a single record."""
+        if not self.count:
+            self._start()
+            self.stream.write(b'>')
+        element = _dump_record(self._maker, record)
+        if self.pretty_print:
+            etree.indent(element, level=1)
+            self.stream.write(b'\n  ')
+        self.stream.write(etree.tostring(element, encoding='UTF-8'))
+        self.count += 1
+
+    def close(self):
+        """Write the collection end, the stream is left open."""
+        if self.closed:
+            return
+        if not self.count:
+            self._start()
+            self.stream.write(b'/>')
+        elif self.pretty_print:
+            self.stream.write(b'\n</collection>')
+        else:
+            self.stream.write(b'</collection>')
+        if self.pretty_print:
+            self.stream.write(b'\n')
+        self.closed = True
+
+    def __enter__(self):
+        """Return the writer."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the collection."""
+        self.close()
+
+
+def dump_stream(records, stream, pretty_print=True):
+    """Write records into a MarcXML file object one record at a time.
+
+    The output is the same as from :func:`dumps`, see
+    :class:`MARCXMLWriter`.
+
+    .. versionadded:: 1.8.0
+    """
+    if isinstance(records, dict):
+        stream.write(dumps(records, pretty_print=pretty_print))
+        return
+
+    with MARCXMLWriter(stream, pretty_print=pretty_print) as writer:
+        for record in records:
+            writer.write(record)
+
+
+dumps.__stream__ = dump_stream
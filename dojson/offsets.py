@@ -0,0 +1,265 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sidecar indexes of record offsets in data files.
+
+An :class:`OffsetIndex` keeps the byte range of every record in a file
+together with record numbers by key, e.g. by control number, so that
+single records can be read without scanning the file.  Indexes are saved
+next to the data file and are valid only as long as the file keeps its
+size and modification time.
+
+Readers built on :class:`IndexedReader` memory map the file and parse only
+the byte ranges of requested records.
+
+.. code-block:: python
+
+    from dojson.contrib.marc21.utils import Reader
+
+    with Reader('records.xml') as reader:
+        record = reader.get('123456')
+        first = reader[0:10]
+
+.. versionadded:: 1.8.0
+"""
+
+import io
+import mmap
+import os
+import pickle
+import tempfile
+from array import array
+
+import simplejson as json
+
+from ._compat import text_type
+from .compression import detect
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler restricted to built-in data types."""
+
+    def find_class(self, module, name):
+        """Refuse to load any class or function."""
+        raise pickle.UnpicklingError(
+            'Global {0}.{1} is not allowed.'.format(module, name)
+        )
+
+
+class OffsetIndex(object):
+    """Byte ranges of records in a file and record numbers by key."""
+
+    VERSION = 1
+    """Version of the saved format."""
+
+    def __init__(self, stat=None):
+        """Create an empty index for a file with ``(size, mtime_ns)``."""
+        self.stat = stat
+        self.starts = array('Q')
+        self.ends = array('Q')
+        self.keys = {}
+
+    @staticmethod
+    def sidecar(path):
+        """Return default location of the index of a data file."""
+        return '{0}.idx'.format(path)
+
+    @staticmethod
+    def file_stat(path):
+        """Return ``(size, mtime_ns)`` identifying contents of a file."""
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def __len__(self):
+        """Return number of records."""
+        return len(self.starts)
+
+    def __getitem__(self, number):
+        """Return ``(start, end)`` byte offsets of a record."""
+        return self.starts[number], self.ends[number]
+
+    def append(self, start, end, key=None):
+        """Add a record, the first record with a key wins."""
+        if key is not None:
+            self.keys.setdefault(key, len(self.starts))
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def find(self, key):
+        """Return number of the record with a key or ``None``."""
+        return self.keys.get(key)
+
+    def save(self, path):
+        """Write the index atomically to ``path``."""
+        fp = io.BytesIO()
+        pickle.dump({
+            'version': self.VERSION,
+            'stat': self.stat,
+            'starts': self.starts.tobytes(),
+            'ends': self.ends.tobytes(),
+            'keys': self.keys,
+        }, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as out:
+            out.write(fp.getvalue())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, stat=None):
+        """Return index saved in ``path`` or ``None``.
+
+        ``None`` is returned also when the index is not readable or was
+        built for a file with different ``(size, mtime_ns)`` than ``stat``.
+        Only built-in data types are unpickled.
+        """
+        try:
+            with open(path, 'rb') as fp:
+                data = _Unpickler(fp).load()
+            if data['version'] != cls.VERSION or \
+                    (stat is not None and tuple(data['stat']) != stat):
+                return None
+            index = cls(stat=tuple(data['stat']))
+            index.starts.frombytes(data['starts'])
+            index.ends.frombytes(data['ends'])
+            index.keys = data['keys']
+        except Exception:
+            return None
+        return index
+
+
+def check_uncompressed(path, head):
+    """Raise :exc:`ValueError` if ``head`` of a file is compressed data."""
+    compression = detect(head)
+    if compression is not None:
+        raise ValueError(
+            'File {0} is {1} compressed, records in compressed files '
+            'cannot be read by offsets. Decompress it first.'.format(
+                path, compression
+            )
+        )
+
+
+class IndexedReader(object):
+    """Random access to records of a file using an :class:`OffsetIndex`.
+
+    The index is loaded from ``index_path`` or built on first use and saved
+    there.  Subclasses implement :meth:`build_index` and :meth:`parse`.
+    """
+
+    def __init__(self, path, index_path=None, save_index=True):
+        """Open the file and load or build its index.
+
+        :param path: path of the data file.
+        :param index_path: location of the index, defaults to the path of
+                           the file with ``.idx`` suffix.
+        :param save_index: save built index to ``index_path``.
+        :raises ValueError: if the file is compressed.
+        """
+        self.path = path
+        self.index_path = index_path or OffsetIndex.sidecar(path)
+
+        stat = OffsetIndex.file_stat(path)
+        self._data = b''
+        if stat[0]:
+            with open(path, 'rb') as fp:
+                check_uncompressed(path, fp.read(8))
+                self._data = mmap.mmap(
+                    fp.fileno(), 0, access=mmap.ACCESS_READ
+                )
+
+        self.index = OffsetIndex.load(self.index_path, stat)
+        if self.index is None:
+            self.index = self.build_index(stat)
+            if save_index:
+                try:
+                    self.index.save(self.index_path)
+                except OSError:
+                    pass
+
+    def build_index(self, stat):
+        """Scan the file and return its index."""
+        raise NotImplementedError()
+
+    def parse(self, start, end):
+        """Return record from a byte range of the file."""
+        raise NotImplementedError()
+
+    def __enter__(self):
+        """Return the reader."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the memory map."""
+        self.close()
+
+    def close(self):
+        """Close the memory map."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __len__(self):
+        """Return number of records."""
+        return len(self.index)
+
+    def __getitem__(self, number):
+        """Return record by its number or list of records by a slice."""
+        if isinstance(number, slice):
+            return [self[position]
+                    for position in range(*number.indices(len(self)))]
+        return self.parse(*self.index[number])
+
+    def __iter__(self):
+        """Iterate over all records."""
+        for number in range(len(self)):
+            yield self[number]
+
+    def get(self, key, default=None):
+        """Return record with given key, e.g. control number."""
+        number = self.index.find(key)
+        if number is None:
+            return default
+        return self[number]
+
+
+class JSONLinesReader(IndexedReader):
+    """Random access to records of a JSON Lines file.
+
+    Records are found by line number or by the value of the first of
+    ``key_fields`` present in a record.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, path, key_fields=('001', 'control_number'), **kwargs):
+        """Open the file, see :class:`~dojson.offsets.IndexedReader`."""
+        self.key_fields = key_fields
+        super(JSONLinesReader, self).__init__(path, **kwargs)
+
+    def build_index(self, stat):
+        """Return index of non-empty lines by key."""
+        index = OffsetIndex(stat=stat)
+        data = self._data
+        start = 0
+        while start < len(data):
+            end = data.find(b'\n', start)
+            if end == -1:
+                end = len(data)
+            line = data[start:end]
+            if line.strip():
+                record = json.loads(line.decode('utf-8'))
+                key = None
+                for field in self.key_fields:
+                    value = record.get(field) \
+                        if isinstance(record, dict) else None
+                    if isinstance(value, (text_type, int)):
+                        key = value
+                        break
+                index.append(start, end, key)
+            start = end + 1
+        return index
+
+    def parse(self, start, end):
+        """Return record from a line."""
+        return json.loads(self._data[start:end].decode('utf-8'))
@@ -3,11 +3,23 @@
 
 """Do JSON translation."""
 
+import hashlib
+import importlib
+import importlib.util
+import io
+import os
+import pickle
 import re
+import string
+import sys
+import tempfile
+import time
+from collections import OrderedDict
 
-from ._compat import iteritems, zip_longest
+from ._compat import iteritems
 from .errors import IgnoreKey, MissingRule
-from .utils import GroupableOrderedDict, entry_points
+from .utils import IGNORE_KEY, entry_points
+from .version import __version__
 
 try:
     from _sre import MAXGROUPS
@@ -26,61 +38,745 @@ class Index(object):
         :param branch_size: number of groups in a branch (max. 99)
         """
         self._patterns = []
+        self._offsets = []
         self.flags = flags
-        self.rules = rules or []
-        self.branch_size = min(branch_size, len(self.rules))
+        self.rules = []
+        self.branch_size = branch_size
+        self.extend(rules or [])
+
+    def extend(self, rules):
+        """Append rules to the index.
+
+        Only the last, not yet full, branch is recompiled together with
+        new branches for the appended rules.
 
+        .. versionadded:: 1.8.0
+        """
         def make_pattern(rules, flags=0):
             """Compile a rules to single branch with groups."""
             return re.compile('|'.join('(?P<I{name}>{regex})'.format(
                 name=name, regex=regex
             ) for name, (regex, _) in enumerate(rules)), flags=flags)
 
-        for rules in zip_longest(*[iter(self.rules)] * self.branch_size):
-            self._patterns.append(make_pattern([
-                rule for rule in rules if rule is not None
-            ]))
+        start = len(self.rules)
+        self.rules.extend(rules)
+        if self._offsets and start - self._offsets[-1] < self.branch_size:
+            start = self._offsets.pop()
+            self._patterns.pop()
 
-    def query(self, key):
-        """Return data matching the key."""
+        for offset in range(start, len(self.rules), self.branch_size):
+            self._offsets.append(offset)
+            self._patterns.append(make_pattern(
+                self.rules[offset:offset + self.branch_size], flags=self.flags
+            ))
+
+    def lookup(self, key):
+        """Return position and data of the first rule matching the key.
+
+        .. versionadded:: 1.8.0
+        """
         for section, pattern in enumerate(self._patterns):
             match = pattern.match(key)
             if match:
-                return self.rules[section * self.branch_size + int(
-                    match.lastgroup[1:]
-                )][1]
+                position = self._offsets[section] + int(match.lastgroup[1:])
+                return position, self.rules[position][1]
+
+    def query(self, key):
+        """Return data matching the key."""
+        result = self.lookup(key)
+        if result:
+            return result[1]
+
+
+_ANY = ~(1 << ord('\n'))
+"""Mask of characters matched by ``.`` (everything but a newline)."""
+
+_LITERALS = frozenset(string.ascii_letters + string.digits + '_ -')
+"""Characters that stand for themselves outside of a character class."""
+
+
+def _split_pattern(regex):
+    """Split a regular expression into per-position character masks.
+
+    Only expressions built from literal characters, ``.`` and simple
+    character classes (optionally anchored with ``^`` and ``$``) are
+    supported.  Returns ``(masks, exact)`` where every mask is an integer
+    bitset over character ordinals, or ``None`` for other expressions.
+    """
+    start = 1 if regex.startswith('^') else 0
+    end = len(regex)
+    exact = regex.endswith('$') and not regex.endswith('\\$')
+    if exact:
+        end -= 1
+
+    masks = []
+    pos = start
+    while pos < end:
+        char = regex[pos]
+        if char == '.':
+            masks.append(_ANY)
+        elif char == '[':
+            close = regex.find(']', pos + 1, end)
+            members = regex[pos + 1:close]
+            if close == -1 or not members or members[0] == '^' or \
+                    '\\' in members or '[' in members:
+                return None
+            mask = 0
+            index = 0
+            while index < len(members):
+                if index + 2 < len(members) and members[index + 1] == '-':
+                    low, high = ord(members[index]), ord(members[index + 2])
+                    if low > high:
+                        return None
+                    for code in range(low, high + 1):
+                        mask |= 1 << code
+                    index += 3
+                else:
+                    mask |= 1 << ord(members[index])
+                    index += 1
+            masks.append(mask)
+            pos = close
+        elif char in _LITERALS:
+            masks.append(1 << ord(char))
+        else:
+            return None
+        pos += 1
+
+    return masks, exact
+
+
+class TableIndex(object):
+    """Index dispatching keys through a tag-keyed decision table.
+
+    Rules of the form ``^245..`` or ``^650[_120][341750_26]``, i.e. a
+    literal three character tag followed by character classes, are stored
+    in a table keyed by the tag with one bitset per following position.
+    Anchored literals such as ``^main_entry_personal_name$`` are served
+    from a plain dictionary.  Remaining rules are matched by a regular
+    expression based :class:`Index`.  The first registered rule matching a
+    key wins, exactly like with :class:`Index`.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, rules=None, flags=0, branch_size=MAXGROUPS - 1):
+        """Initialize index structures.
+
+        :param rules: list of tuples (regular expression, data)
+        :param flags: additional flags passed to SRE parser (rules are
+                      matched only by regular expressions when set)
+        :param branch_size: number of groups in a fallback branch
+        """
+        self.flags = flags
+        self.branch_size = branch_size
+        self.rules = []
+        self._literals = {}
+        self._table = {}
+        self._fallback = None
+        self._fallback_positions = []
+        self.extend(rules or [])
+
+    def extend(self, rules):
+        """Append rules to the index without recompiling existing ones."""
+        rules = list(rules)
+        fallback = []
+        for position, (regex, data) in enumerate(rules, len(self.rules)):
+            split = None if self.flags else _split_pattern(regex)
+            if split is None or len(split[0]) < 3 or \
+                    any(mask & (mask - 1) for mask in split[0][:3]):
+                fallback.append((regex, data))
+                self._fallback_positions.append(position)
+                continue
+
+            masks, exact = split
+            if exact and not any(mask & (mask - 1) for mask in masks):
+                literal = ''.join(chr(mask.bit_length() - 1) for mask in masks)
+                # ``$`` also matches before a trailing newline.
+                for name in (literal, literal + '\n'):
+                    self._literals.setdefault(name, (position, data))
+                continue
+
+            tag = ''.join(chr(mask.bit_length() - 1) for mask in masks[:3])
+            self._table.setdefault(tag, []).append(
+                (position, tuple(masks[3:]), exact, data)
+            )
+        self.rules.extend(rules)
+
+        if fallback:
+            if self._fallback is None:
+                self._fallback = Index(flags=self.flags,
+                                       branch_size=self.branch_size)
+            self._fallback.extend(fallback)
+
+    def lookup(self, key):
+        """Return position and data of the first rule matching the key."""
+        found = self._literals.get(key)
+        for position, masks, exact, data in self._table.get(key[:3], ()):
+            if found is not None and found[0] < position:
+                break
+            length = 3 + len(masks)
+            if len(key) < length or \
+                    (exact and key[length:] not in ('', '\n')):
+                continue
+            for offset, mask in enumerate(masks, 3):
+                if not (mask >> ord(key[offset])) & 1:
+                    break
+            else:
+                found = position, data
+                break
+
+        if self._fallback is not None and (
+                found is None or self._fallback_positions[0] < found[0]):
+            result = self._fallback.lookup(key)
+            if result:
+                position = self._fallback_positions[result[0]]
+                if found is None or position < found[0]:
+                    found = position, result[1]
+
+        return found
+
+    def query(self, key):
+        """Return data matching the key."""
+        result = self.lookup(key)
+        if result:
+            return result[1]
+
+
+class LRUCache(object):
+    """Bounded mapping evicting the least recently used key.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, maxsize):
+        """Initialize the cache.
+
+        :param maxsize: maximum number of cached keys.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """Return number of cached keys."""
+        return len(self._entries)
+
+    def get(self, key, factory):
+        """Return cached value, storing ``factory(key)`` for missing keys."""
+        entries = self._entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self.misses += 1
+            value = entries[key] = factory(key)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        else:
+            self.hits += 1
+            entries.move_to_end(key)
+        return value
+
+    def discard(self, predicate):
+        """Remove cached keys for which ``predicate(value)`` is true."""
+        for key, value in list(self._entries.items()):
+            if predicate(value):
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all cached keys and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class CachedIndex(LRUCache):
+    """Bounded memoizing cache in front of an index.
+
+    Results of :meth:`lookup`, including misses, are kept for the most
+    recently used ``maxsize`` keys.  The least recently used key is evicted
+    when the cache is full.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, index, maxsize=4096):
+        """Initialize the cache.
+
+        :param index: index instance with a ``lookup`` method.
+        :param maxsize: maximum number of cached keys.
+        """
+        super(CachedIndex, self).__init__(maxsize)
+        self.index = index
+
+    def lookup(self, key):
+        """Return position and data of the first rule matching the key."""
+        return self.get(key, self.index.lookup)
+
+    def query(self, key):
+        """Return data matching the key."""
+        result = self.lookup(key)
+        if result:
+            return result[1]
+
+    def extend(self, rules):
+        """Append rules to the index.
+
+        Cached matches stay valid because appended rules never take
+        precedence over existing ones, only cached misses are dropped.
+        """
+        self.index.extend(rules)
+        self.discard(lambda result: result is None)
+
+
+_TAG_RANGES_NAME = re.compile(r'^[a-z]{2}(?:(?:[a-z]{2})?(?:\d[\dx]{2}|leader))+$')
+"""Entry point names encoding tag ranges, e.g. ``bd20x24x`` or ``hd85xhd88x``."""
+
+_TAG_KEY = re.compile(r'^(?:\d{3}|leader)')
+"""Keys starting with a tag which can be compared with tag ranges."""
+
+
+def _tag_ranges(name):
+    """Return list of ``(low, high)`` tags declared by an entry point name.
+
+    Two tags with wildcards declare an inclusive range (``bd20x24x`` covers
+    200 to 249), as do two tags of the same ten (``ad663666`` covers 663 to
+    666).  Otherwise every tag covers its own digits (``ad260360`` and
+    ``hd3xx5xx84x``).  Returns ``None`` for names not declaring tags.
+    """
+    if not _TAG_RANGES_NAME.match(name):
+        return None
+    tags = re.findall(r'\d[\dx]{2}|leader', name[2:])
+    ranges = [(tag.replace('x', '0'), tag.replace('x', '9')) for tag in tags]
+    if len(ranges) == 2 and 'leader' not in tags and (
+            'x' in tags[0] + tags[1] or tags[0][:2] == tags[1][:2]):
+        return [(ranges[0][0], ranges[1][1])]
+    return ranges
+
+
+class OverlayIndex(object):
+    """Index layering own rules on top of shared, already built indexes.
+
+    Rules of every layer are numbered after the rules of previous layers,
+    so the first matching rule wins across layers.  Only the first
+    ``size`` rules of a layer are visible, which keeps the overlay valid
+    when rules are later appended to a shared index.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, layers, index):
+        """Initialize the overlay.
+
+        :param layers: list of tuples (built index, number of visible rules)
+        :param index: index with own rules that is extended by new rules.
+        """
+        self.layers = layers
+        self.index = index
+
+    def lookup(self, key):
+        """Return position and data of the first rule matching the key."""
+        offset = 0
+        for index, size in self.layers:
+            result = index.lookup(key)
+            if result is not None and result[0] < size:
+                return offset + result[0], result[1]
+            offset += size
+
+        result = self.index.lookup(key)
+        if result is not None:
+            return offset + result[0], result[1]
+
+    def query(self, key):
+        """Return data matching the key."""
+        result = self.lookup(key)
+        if result:
+            return result[1]
+
+    def extend(self, rules):
+        """Append own rules."""
+        self.index.extend(rules)
+
+
+def _resolve(module, qualname):
+    """Return object with given qualified name from a module."""
+    obj = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr, None)
+    return obj
+
+
+class _CreatorReference(object):
+    """Creator restored from a snapshot and imported on first call."""
+
+    def __init__(self, module, qualname, extend):
+        """Initialize reference."""
+        self.module = module
+        self.qualname = qualname
+        self.__extend__ = extend
+        self._creator = None
+
+    def __call__(self, *args, **kwargs):
+        """Import the creator if needed and call it."""
+        if self._creator is None:
+            self._creator = _resolve(self.module, self.qualname)
+        return self._creator(*args, **kwargs)
+
+
+class Batch(object):
+    """Iterator over translated blobs collecting batch statistics.
+
+    :attr:`records` counts translated blobs, :attr:`errors` blobs that
+    failed and :attr:`elapsed` the seconds spent translating them.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, translate, blobs, on_error=None):
+        """Initialize the batch.
+
+        :param translate: function translating a single blob.
+        :param blobs: iterable of blobs.
+        :param on_error: function called with position, blob and exception
+                         for blobs that failed, or ``None`` to raise.
+        """
+        self.records = 0
+        """Number of translated blobs."""
+        self.errors = 0
+        """Number of blobs that failed."""
+        self.elapsed = 0.0
+        """Seconds spent translating blobs."""
+        self._results = self._translate(translate, blobs, on_error)
+
+    def __iter__(self):
+        """Return iterator over translated blobs."""
+        return self
+
+    def __next__(self):
+        """Return next translated blob."""
+        return next(self._results)
+
+    def _translate(self, translate, blobs, on_error):
+        """Translate blobs and update statistics."""
+        clock = time.perf_counter
+        for position, blob in enumerate(blobs):
+            start = clock()
+            try:
+                result = translate(blob)
+            except Exception as exc:
+                self.elapsed += clock() - start
+                self.errors += 1
+                if on_error is None:
+                    raise
+                on_error(position, blob, exc)
+                continue
+            self.elapsed += clock() - start
+            self.records += 1
+            yield result
+
+
+def _clean_missing(exc, output, key, value):
+    """Remove key without a rule from the output order."""
+    order = output.get('__order__')
+    if order:
+        order.remove(key)
+
+
+_HANDLERS = {
+    False: {IgnoreKey: None},
+    True: {IgnoreKey: None, MissingRule: _clean_missing},
+}
+"""Default exception handlers indexed by ``ignore_missing``."""
 
 
 class Overdo(object):
     """Translation index."""
 
-    def __init__(self, bases=None, entry_point_group=None):
-        """Initialize."""
+    def __init__(self, bases=None, entry_point_group=None,
+                 index_class=TableIndex, cache_size=4096, snapshot_dir=None,
+                 lazy=False, plan_cache_size=1024):
+        """Initialize.
+
+        :param index_class: class used to build the rule index.  Instances
+                            are created from a list of rules and provide
+                            ``lookup``, ``query`` and ``extend`` methods.
+        :param cache_size: number of keys kept in the lookup cache in front
+                           of the index (``0`` disables the cache).
+        :param snapshot_dir: directory where snapshots of the built rule
+                             table and index are stored and restored from.
+        :param lazy: Set to ``True`` to import entry points with names
+                     declaring tag ranges (e.g. ``bd20x24x``) only when a key
+                     in the range is processed.  Such modules must register
+                     rules only for the declared tags.
+        :param plan_cache_size: number of conversion plans, i.e. resolved
+                                rules for a sequence of keys, kept by
+                                :meth:`do` (``0`` disables plans).
+
+        .. versionchanged:: 1.8.0
+
+           ``index_class`` allows to choose the rule index implementation,
+           ``cache_size`` to bound the :class:`CachedIndex`,
+           ``snapshot_dir`` to persist the built index, ``lazy`` to load
+           rule modules on demand and ``plan_cache_size`` to bound the
+           conversion plan cache.
+        """
         self.rules = []
+        self._bases = []
         if bases:
             for base in bases:
                 base._collect_entry_points()
+                base.load_entry_points()
+                self._bases.append((base, len(base.rules)))
                 self.rules.extend(base.rules)
         self.entry_point_group = entry_point_group
+        self.index_class = index_class
+        self.cache_size = cache_size
+        self.snapshot_dir = snapshot_dir
+        self.lazy = lazy
+        self.plans = LRUCache(plan_cache_size) if plan_cache_size else None
+        """:class:`LRUCache` of conversion plans by keys or ``None``.
+
+        Its ``hits`` and ``misses`` count plan lookups.
+        """
         self.index = None
+        self._restored = set()
+        self._pending = None
+        self._seen = set()
 
     def _collect_entry_points(self):
-        """Collect entry points."""
-        if self.entry_point_group is not None:
-            for entry_point in entry_points(group=self.entry_point_group):
+        """Collect entry points.
+
+        In lazy mode entry points declaring tag ranges are only remembered
+        and loaded later by :meth:`load_entry_points`.
+        """
+        if self.entry_point_group is None or \
+                (self.lazy and self._pending is not None):
+            return
+
+        pending = {}
+        for entry_point in entry_points(group=self.entry_point_group):
+            ranges = _tag_ranges(entry_point.name) if self.lazy else None
+            if ranges is None:
                 entry_point.load()
+            else:
+                pending[entry_point.name] = (ranges, entry_point)
+
+        if self.lazy:
+            self._pending = pending
+
+    def load_entry_points(self, keys=None):
+        """Load lazily collected entry points with rules for given keys.
+
+        :param keys: iterable of keys or ``None`` to load all entry points.
+                     All entry points are loaded as well for keys not
+                     starting with a tag, e.g. the JSON names used by
+                     reverse MARC 21 translation.
+
+        Returns ``True`` when a module has been loaded.
+
+        .. versionadded:: 1.8.0
+        """
+        if not self._pending:
+            return False
+
+        if keys is not None:
+            keys = [key for key in keys if key not in self._seen]
+            self._seen.update(keys)
+            if not all(_TAG_KEY.match(key) for key in keys):
+                keys = None
+
+        if keys is None:
+            matching = list(self._pending)
+        else:
+            matching = [
+                name for name, (ranges, _) in self._pending.items()
+                if any(low <= key[:len(low)] <= high
+                       for key in keys for low, high in ranges)
+            ]
+
+        for name in matching:
+            _, entry_point = self._pending.pop(name)
+            entry_point.load()
+        return bool(matching)
+
+    def _build_for(self, blob):
+        """Build index with rules for keys of the blob."""
+        if self.index is None:
+            self.build()
+        if self._pending and self.load_entry_points(blob.keys()) and \
+                self.index is None:
+            self.build()
 
     def build(self):
-        """Build."""
-        self._collect_entry_points()
-        self.index = Index(self.rules)
+        """Build.
+
+        .. versionchanged:: 1.8.0
+
+           Restores the rule table and index from a snapshot, or saves one
+           after building, when ``snapshot_dir`` is set.
+        """
+        index = path = None
+        if self.snapshot_dir is not None:
+            path = self.snapshot_path()
+            index = self.load_snapshot(path)
+
+        if index is None:
+            self._collect_entry_points()
+            index = self._make_index()
+            if path is not None and not self._pending:
+                self.save_snapshot(index, path)
+
+        if self.cache_size:
+            index = CachedIndex(index, maxsize=self.cache_size)
+        self.index = index
+        if self.plans is not None:
+            self.plans.clear()
+
+    def _make_index(self):
+        """Create index, reusing indexes of bases when possible."""
+        layers = []
+        for base, size in self._bases:
+            if base.index is None:
+                base.build()
+            layers.append((base.index, size))
+
+        if not layers:
+            return self.index_class(self.rules)
+
+        return OverlayIndex(
+            layers, self.index_class(self.rules[sum(s for _, s in layers):])
+        )
+
+    def snapshot_path(self):
+        """Return snapshot location for the current rules and environment.
+
+        The file name contains a digest of the Python and DoJSON versions,
+        the index class, the rules registered so far and the entry points
+        of ``entry_point_group`` together with versions and modification
+        times of the modules providing them.
+
+        .. versionadded:: 1.8.0
+        """
+        eps = []
+        if self.entry_point_group is not None:
+            for entry_point in entry_points(group=self.entry_point_group):
+                module = entry_point.value.split(':')[0]
+                dist = getattr(entry_point, 'dist', None)
+                spec = importlib.util.find_spec(module)
+                stat = os.stat(spec.origin) if spec and spec.has_location \
+                    else None
+                eps.append((
+                    entry_point.name, entry_point.value,
+                    (dist.name, dist.version) if dist else None,
+                    (stat.st_mtime_ns, stat.st_size) if stat else None,
+                ))
+
+        signature = repr((
+            sys.version_info[:2], __version__,
+            self.index_class.__module__, self.index_class.__qualname__,
+            os.stat(sys.modules[self.index_class.__module__].__file__)
+            .st_mtime_ns,
+            [(regex, name, getattr(creator, '__module__', None),
+              getattr(creator, '__qualname__', None))
+             for regex, (name, creator) in self.rules],
+            sorted(eps),
+        ))
+        return os.path.join(self.snapshot_dir, '{0}-{1}.pickle'.format(
+            self.entry_point_group or 'overdo',
+            hashlib.sha1(signature.encode('utf-8')).hexdigest(),
+        ))
+
+    def save_snapshot(self, index, path):
+        """Save the rule table and a built index to ``path``.
+
+        Creators are stored by reference, so snapshots can be written only
+        when all of them are importable module level functions.  Returns
+        ``False`` when the snapshot could not be written.
+
+        .. versionadded:: 1.8.0
+        """
+        creators = {}
+        for _, (_, creator) in self.rules:
+            module = getattr(creator, '__module__', None)
+            qualname = getattr(creator, '__qualname__', None)
+            if isinstance(creator, _CreatorReference):
+                module, qualname = creator.module, creator.qualname
+            elif module is None or qualname is None or \
+                    _resolve(module, qualname) is not creator:
+                return False
+            creators[id(creator)] = (
+                module, qualname, getattr(creator, '__extend__', False)
+            )
+
+        fp = io.BytesIO()
+        pickler = pickle.Pickler(fp, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = lambda obj: creators.get(id(obj))
+        try:
+            pickler.dump((self.rules, index))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as out:
+            out.write(fp.getvalue())
+        os.replace(tmp, path)
+        return True
+
+    def load_snapshot(self, path):
+        """Restore the rule table and return the index saved in ``path``.
+
+        Entry points are not collected and no rule is compiled when the
+        snapshot exists.  Creators are imported on their first use, so only
+        modules with rules matching the processed keys are loaded.  Returns
+        ``None`` when there is no usable snapshot.
+
+        .. warning::
+
+           Snapshots are pickle files, ``snapshot_dir`` must not be writable
+           by untrusted users.
+
+        .. versionadded:: 1.8.0
+        """
+        references = {}
+
+        def persistent_load(pid):
+            if pid not in references:
+                references[pid] = _CreatorReference(*pid)
+            return references[pid]
+
+        try:
+            with open(path, 'rb') as fp:
+                unpickler = pickle.Unpickler(fp)
+                unpickler.persistent_load = persistent_load
+                rules, index = unpickler.load()
+        except Exception:
+            return None
+
+        self.rules = rules
+        self._restored = set(
+            (regex, name, creator.module, creator.qualname)
+            for regex, (name, creator) in rules
+            if isinstance(creator, _CreatorReference)
+        )
+        return index
 
     def over(self, name, *source_tags):
         """Register creator rule."""
         def decorator(creator):
-            self.index = None
-            for field in source_tags:
-                self.rules.append((field, (name, creator)))
+            signature = (getattr(creator, '__module__', None),
+                         getattr(creator, '__qualname__', None))
+            if all((field, name) + signature in self._restored
+                   for field in source_tags):
+                # Already registered by a restored snapshot.
+                return creator
+            rules = [(field, (name, creator)) for field in source_tags]
+            self.rules.extend(rules)
+            if self.index is not None:
+                self.index.extend(rules)
+            if self.plans is not None:
+                self.plans.clear()
             return creator
         return decorator
 
@@ -108,54 +804,129 @@ class Overdo(object):
 
            ``exception_handlers`` allows to set custom handlers for
            non-standard MARC codes.
+
+        .. versionchanged:: 1.8.0
+
+           Handlers of :class:`~dojson.errors.IgnoreKey` and
+           :class:`~dojson.errors.MissingRule` are also called for creators
+           returning :data:`~dojson.utils.IGNORE_KEY` and for keys without a
+           rule, without raising the exception.
         """
-        handlers = {IgnoreKey: None}
-        handlers.update(exception_handlers or {})
+        handlers = self._handlers(ignore_missing, exception_handlers)
+        self._build_for(blob)
+        return self._do(blob, handlers)
+
+    def do_many(self, blobs, ignore_missing=True, exception_handlers=None,
+                on_error=None):
+        """Translate an iterable of blobs sharing the same options.
+
+        Exception handlers are prepared once for the whole batch.  The
+        returned :class:`Batch` yields translated blobs and counts records,
+        errors and time spent translating.
+
+        :param blobs: iterable of ``dict``-like objects.
+        :param ignore_missing: see :meth:`do`.
+        :param exception_handlers: see :meth:`do`.
+        :param on_error: Give a function called with the position of the
+                         blob, the blob and the exception to skip blobs
+                         that could not be translated.  The exception is
+                         raised when it is not set.
+
+        .. versionadded:: 1.8.0
+        """
+        handlers = self._handlers(ignore_missing, exception_handlers)
+
+        def translate(blob):
+            self._build_for(blob)
+            return self._do(blob, handlers)
 
-        def clean_missing(exc, output, key, value):
-            order = output.get('__order__')
-            if order:
-                order.remove(key)
+        return Batch(translate, blobs, on_error=on_error)
 
+    def _handlers(self, ignore_missing, exception_handlers):
+        """Return exception handlers for given options."""
+        if exception_handlers is None:
+            return _HANDLERS[bool(ignore_missing)]
+
+        handlers = {IgnoreKey: None}
+        handlers.update(exception_handlers)
         if ignore_missing:
-            handlers.setdefault(MissingRule, clean_missing)
+            handlers.setdefault(MissingRule, _clean_missing)
+        return handlers
 
+    def _do(self, blob, handlers):
+        """Translate blob values using prepared exception handlers."""
         output = {}
 
-        if self.index is None:
-            self.build()
-
-        if isinstance(blob, GroupableOrderedDict):
+        if hasattr(blob, 'iteritems') and '__order__' in blob:
+            # Grouped records, e.g. GroupableOrderedDict or lazy records.
+            keys = ('__order__',) + tuple(blob['__order__'])
             items = blob.iteritems(repeated=True)
         else:
+            keys = tuple(blob)
             items = iteritems(blob)
 
-        for key, value in items:
-            try:
-                result = self.index.query(key)
-                if not result:
-                    raise MissingRule(key)
+        for (key, value), step in zip(items, self.plan(keys)):
+            if step is None:
+                self._handle(MissingRule(key), handlers, output, key, value)
+                continue
 
-                name, creator = result
+            name, creator, extend = step
+            try:
                 data = creator(output, key, value)
-                if getattr(creator, '__extend__', False):
-                    existing = output.get(name, [])
-                    existing.extend(data)
-                    output[name] = existing
-                else:
-                    output[name] = data
+                if data is not IGNORE_KEY:
+                    if extend:
+                        existing = output.get(name, [])
+                        existing.extend(data)
+                        output[name] = existing
+                    else:
+                        output[name] = data
+                    continue
             except Exception as exc:
-                if exc.__class__ in handlers:
-                    handler = handlers[exc.__class__]
-                    if handler is not None:
-                        handler(exc, output, key, value)
-                else:
-                    raise
+                self._handle(exc, handlers, output, key, value)
+                continue
+            self._handle(IgnoreKey(key), handlers, output, key, value)
 
         return output
 
+    @staticmethod
+    def _handle(exc, handlers, output, key, value):
+        """Pass exception to its handler or raise it when there is none.
+
+        Exceptions signalled by rules without raising them, such as
+        :class:`~dojson.errors.MissingRule` for keys without a rule, are
+        passed here directly.
+        """
+        if exc.__class__ not in handlers:
+            raise exc
+        handler = handlers[exc.__class__]
+        if handler is not None:
+            handler(exc, output, key, value)
+
+    def plan(self, keys):
+        """Return conversion plan for a sequence of keys.
+
+        The plan contains a ``(name, creator, extend)`` step for every key,
+        or ``None`` for keys without a matching rule.  Plans are cached in
+        :attr:`plans` and dropped whenever a rule is registered.
+
+        .. versionadded:: 1.8.0
+        """
+        if self.plans is None:
+            return self._make_plan(keys)
+        return self.plans.get(keys, self._make_plan)
+
+    def _make_plan(self, keys):
+        """Resolve rules for a sequence of keys."""
+        steps = []
+        for key in keys:
+            result = self.index.query(key)
+            if result:
+                name, creator = result
+                result = name, creator, getattr(creator, '__extend__', False)
+            steps.append(result)
+        return tuple(steps)
+
     def missing(self, blob):
         """Return keys with missing rules."""
-        if self.index is None:
-            self.build()
+        self._build_for(blob)
         return [key for key in blob.keys() if self.index.query(key) is None]
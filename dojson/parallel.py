@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Parallel translation in a pool of worker processes.
+
+Blobs are sent to workers in chunks and translated results are yielded in
+the input order.  At most ``window`` chunks are processed or waiting to be
+yielded at any time, which bounds memory used for reordering.
+
+>>> from dojson.parallel import Executor
+>>> with Executor('marc21', jobs=2) as executor:
+...     records = list(executor.do([{'245__': {'a': 'Test title'}}]))
+>>> records[0]['title_statement']['title']
+'Test title'
+
+Rules are passed to workers by entry point name in the ``dojson.cli.rule``
+group or as ``module:attribute`` references.  Other rule objects are
+passed as they are, which requires them to be picklable unless workers
+are forked.
+
+Any picklable function can be applied to items with :meth:`Executor.map`,
+:func:`chain` and :func:`translate` help with composing them:
+
+>>> from functools import partial
+>>> from dojson.parallel import chain, translate
+>>> function = partial(chain, [partial(translate, 'marc21', True), len])
+>>> with Executor(jobs=2) as executor:
+...     list(executor.map(function, [{'245__': {'a': 'Test title'}}]))
+[1]
+"""
+
+import collections
+import concurrent.futures
+import functools
+import importlib
+import itertools
+import os
+import pickle
+
+from .utils import entry_points
+
+_rule = None
+"""Rule used by the current worker process."""
+
+_rules = {}
+"""Rules loaded by :func:`load_rule` in the current process."""
+
+
+def resolve_rule(reference):
+    """Return rule for an entry point name or ``module:attribute`` string.
+
+    Other objects are returned unchanged.
+    """
+    if not isinstance(reference, str):
+        return reference
+
+    if ':' in reference:
+        module, attribute = reference.split(':', 1)
+        rule = importlib.import_module(module)
+        for name in attribute.split('.'):
+            rule = getattr(rule, name)
+        return rule
+
+    for entry_point in entry_points(group='dojson.cli.rule'):
+        if entry_point.name == reference:
+            return entry_point.load()
+    raise LookupError('Rule {0} is not registered.'.format(reference))
+
+
+def rule_reference(rule):
+    """Return entry point name of a rule or the rule itself."""
+    if rule is None or isinstance(rule, str):
+        return rule
+    for entry_point in entry_points(group='dojson.cli.rule'):
+        if entry_point.load() is rule:
+            return entry_point.name
+    return rule
+
+
+def load_rule(reference):
+    """Return built rule for a reference and keep it for later calls."""
+    if not isinstance(reference, str):
+        rule = reference
+    elif reference in _rules:
+        return _rules[reference]
+    else:
+        rule = _rules[reference] = resolve_rule(reference)
+    if rule.index is None:
+        rule.build()
+    return rule
+
+
+def translate(reference, ignore_missing, blob):
+    """Translate a blob with the rule for a reference."""
+    return load_rule(reference).do(blob, ignore_missing=ignore_missing)
+
+
+def chain(functions, item):
+    """Apply functions to an item one after another."""
+    for function in functions:
+        item = function(item)
+    return item
+
+
+def _initialize(reference):
+    """Load and build the rule in a new worker process."""
+    global _rule
+    if reference is not None:
+        _rule = load_rule(reference)
+
+
+def _portable(exc):
+    """Return exception that can be sent back to the parent process."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError('{0}: {1}'.format(exc.__class__.__name__, exc))
+    return exc
+
+
+def _translate(blobs, ignore_missing, exception_handlers):
+    """Translate a chunk of blobs and collect errors by position."""
+    errors = []
+
+    def on_error(position, blob, exc):
+        errors.append((position, _portable(exc)))
+
+    results = list(_rule.do_many(
+        blobs, ignore_missing=ignore_missing,
+        exception_handlers=exception_handlers, on_error=on_error,
+    ))
+    return results, errors
+
+
+def _apply(function, items):
+    """Apply a function to a chunk of items and collect errors by position."""
+    results = []
+    errors = []
+    for position, item in enumerate(items):
+        try:
+            results.append(function(item))
+        except Exception as exc:
+            errors.append((position, _portable(exc)))
+    return results, errors
+
+
+class Executor(object):
+    """Translate blobs with a rule in a pool of worker processes.
+
+    .. versionadded:: 1.8.0
+    """
+
+    def __init__(self, rule=None, jobs=None, chunk_size=100, window=None,
+                 mp_context=None):
+        """Start worker processes.
+
+        :param rule: rule, entry point name or ``module:attribute`` used by
+                     :meth:`do`.
+        :param jobs: number of worker processes (defaults to CPU count).
+        :param chunk_size: number of blobs sent to a worker at once.
+        :param window: maximum number of chunks in flight (defaults to twice
+                       the number of workers).
+        :param mp_context: :mod:`multiprocessing` context for the workers.
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.window = window or 2 * self.jobs
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.jobs, mp_context=mp_context,
+            initializer=_initialize, initargs=(rule_reference(rule),),
+        )
+
+    def __enter__(self):
+        """Return the executor."""
+        return self
+
+    def __exit__(self, *args):
+        """Stop worker processes."""
+        self.close()
+
+    def close(self):
+        """Stop worker processes."""
+        self._pool.shutdown(cancel_futures=True)
+
+    def do(self, blobs, ignore_missing=True, exception_handlers=None,
+           on_error=None):
+        """Translate blobs and yield results in the input order.
+
+        :param blobs: iterable of ``dict``-like objects.
+        :param ignore_missing: see :meth:`dojson.overdo.Overdo.do`.
+        :param exception_handlers: see :meth:`dojson.overdo.Overdo.do`, the
+                                   handlers must be picklable.
+        :param on_error: Give a function called with the position of the
+                         blob, the blob and the exception to skip blobs
+                         that could not be translated.  The exception is
+                         raised when it is not set.
+        """
+        task = functools.partial(
+            _translate, ignore_missing=ignore_missing,
+            exception_handlers=exception_handlers,
+        )
+        return self._ordered(task, blobs, on_error)
+
+    def map(self, function, items, on_error=None):
+        """Apply a picklable function to items and yield results in order.
+
+        :param function: function called with one item in a worker.
+        :param items: iterable of picklable items.
+        :param on_error: see :meth:`do`.
+        """
+        return self._ordered(
+            functools.partial(_apply, function), items, on_error
+        )
+
+    def _ordered(self, task, items, on_error):
+        """Submit chunks of items to workers and yield ordered results."""
+        pending = collections.deque()
+        items = iter(items)
+        position = 0
+        try:
+            while True:
+                chunk = list(itertools.islice(items, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(
+                    (position, chunk, self._pool.submit(task, chunk))
+                )
+                position += len(chunk)
+                if len(pending) >= self.window:
+                    yield from self._results(*pending.popleft(), on_error)
+
+            while pending:
+                yield from self._results(*pending.popleft(), on_error)
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _results(position, chunk, future, on_error):
+        """Yield translated chunk and report its errors."""
+        results, errors = future.result()
+        results = iter(results)
+        errors = dict(errors)
+        for index, item in enumerate(chunk):
+            if index not in errors:
+                yield next(results)
+            elif on_error is None:
+                raise errors[index]
+            else:
+                on_error(position + index, item, errors[index])
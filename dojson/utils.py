@@ -9,12 +9,13 @@ import importlib.metadata as m
 import itertools
 import warnings
 from collections import Counter, OrderedDict
+from numbers import Number
 from sys import version_info
 
 import simplejson as json
 
 from ._compat import iteritems
-from .errors import IgnoreItem, IgnoreKey
+from .errors import IgnoreItem
 
 
 def entry_points(group):
@@ -38,16 +39,56 @@ def int_with_default(value, default):
         return default
 
 
+class _Signal(object):
+    """Value returned by a creator instead of raising an exception."""
+
+    def __init__(self, name):
+        """Initialize named signal."""
+        self.name = name
+
+    def __repr__(self):
+        """Return signal name."""
+        return self.name
+
+    def __reduce__(self):
+        """Pickle signals as module globals to keep them singletons."""
+        return self.name
+
+
+IGNORE_KEY = _Signal('IGNORE_KEY')
+"""Returned by a creator to leave its key out of the output.
+
+It is the exception-free equivalent of raising
+:class:`~dojson.errors.IgnoreKey`.
+
+.. versionadded:: 1.8.0
+"""
+
+IGNORE_ITEM = _Signal('IGNORE_ITEM')
+"""Returned by a :func:`for_each_value` creator to skip the current item.
+
+It is the exception-free equivalent of raising
+:class:`~dojson.errors.IgnoreItem`.
+
+.. versionadded:: 1.8.0
+"""
+
+
 def ignore_value(f):
     """Remove key for None value.
 
     .. versionadded:: 0.2.0
+
+    .. versionchanged:: 1.8.0
+
+       Returns :data:`IGNORE_KEY` instead of raising
+       :class:`~dojson.errors.IgnoreKey`.
     """
     @functools.wraps(f)
     def wrapper(self, key, value, **kwargs):
         result = f(self, key, value, **kwargs)
         if result is None:
-            raise IgnoreKey(key)
+            return IGNORE_KEY
         return result
     return wrapper
 
@@ -57,6 +98,8 @@ def filter_values(f):
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
         out = f(*args, **kwargs)
+        if out is IGNORE_KEY:
+            return out
         return dict((k, v) for k, v in iteritems(out) if v is not None)
     return wrapper
 
@@ -68,9 +111,10 @@ def flatten(f):
     """
     @functools.wraps(f)
     def wrapper(self, key, values, **kwargs):
-        return list(itertools.chain.from_iterable(
-            f(self, key, values, **kwargs)
-        ))
+        out = f(self, key, values, **kwargs)
+        if out is IGNORE_KEY:
+            return out
+        return list(itertools.chain.from_iterable(out))
     return wrapper
 
 
@@ -89,9 +133,13 @@ def for_each_value(f):
 
         for value in values:
             try:
-                parsed_values.append(f(self, key, value, **kwargs))
+                result = f(self, key, value, **kwargs)
             except IgnoreItem:
                 continue
+            if result is IGNORE_KEY:
+                return result
+            if result is not IGNORE_ITEM:
+                parsed_values.append(result)
 
         return parsed_values
     return wrapper
@@ -104,9 +152,13 @@ def reverse_for_each_value(f):
         if isinstance(values, (list, tuple, set)):
             if len(values) == 1:
                 return f(self, key, values[0], **kwargs)
-            return [f(self, key, value, **kwargs) for value in values]
+            results = [f(self, key, value, **kwargs) for value in values]
+        else:
+            results = [f(self, key, values, **kwargs)]
 
-        return [f(self, key, values, **kwargs)]
+        if any(result is IGNORE_KEY for result in results):
+            return IGNORE_KEY
+        return results
 
     return wrapper
 
@@ -133,9 +185,118 @@ def reverse_force_list(data):
 
 
 def load(stream):
-    """Load JSON from bytestream."""
-    reader = codecs.getreader("utf-8")
-    return json.load(reader(stream))
+    """Load JSON from bytestream.
+
+    Items of a top-level array are decoded one at a time while they are
+    iterated, other values are returned as they are.
+
+    .. versionchanged:: 1.8.0
+       Top-level arrays are returned as iterators and compressed streams
+       are decompressed.
+    """
+    from .compression import open_input
+
+    values = _iter_json(open_input(stream))
+    for nested, value in values:
+        following = None if nested else next(values, None)
+        if not nested and following is None:
+            return value
+        # Following top-level values are returned too, e.g. JSON Lines.
+        head = (value, ) if nested else (value, following[1])
+        return itertools.chain(head, (item for _, item in values))
+    return iter(())
+
+
+def iter_json(stream, chunk_size=65536):
+    """Yield JSON values from a bytestream one at a time.
+
+    Items of top-level arrays are yielded one by one, other top-level values
+    are yielded as they are.  The stream can contain any number of values
+    separated by whitespace, e.g. JSON Lines, and only one value at a time
+    is kept in memory.
+
+    >>> import io
+    >>> list(iter_json(io.BytesIO(b'[{"a": 1}, {"b": 2}] {"c": 3}')))
+    [{'a': 1}, {'b': 2}, {'c': 3}]
+
+    .. versionadded:: 1.8.0
+    """
+    return (value for _, value in _iter_json(stream, chunk_size))
+
+
+_PARTIAL_JSON = len('-Infinity')
+"""Distance from the buffer end of errors possibly caused by a cut value."""
+
+
+def _is_partial(error, buffer):
+    """Return if a decoding error can be caused by the end of the buffer."""
+    return len(buffer) - error.pos < _PARTIAL_JSON or \
+        error.msg.startswith('Unterminated string')
+
+
+def _iter_json(stream, chunk_size=65536):
+    """Yield JSON values with a flag telling if they are array items."""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    position = 0
+    in_array = False
+    separated = None
+    eof = False
+
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n':
+            position += 1
+        if position == len(buffer) or position > chunk_size:
+            buffer = buffer[position:]
+            position = 0
+        if not buffer:
+            if eof:
+                break
+            data = stream.read(chunk_size)
+            eof = not data
+            buffer = text.decode(data, final=eof)
+            continue
+
+        char = buffer[position]
+        if in_array and char == ']' and separated is not True:
+            in_array = False
+            position += 1
+            continue
+        if in_array and separated is False:
+            if char != ',':
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter", buffer, position
+                )
+            separated = True
+            position += 1
+            continue
+        if not in_array and char == '[':
+            in_array = True
+            separated = None
+            position += 1
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            end = None
+            # Only values cut by the end of the buffer are read further.
+            if eof or not _is_partial(error, buffer):
+                raise
+        # Numbers ending with the buffer can continue in the next chunk.
+        if end is None or (not eof and isinstance(value, Number) and (
+                end == len(buffer) or buffer[end] in '.eE')):
+            data = stream.read(max(chunk_size, len(buffer) - position))
+            eof = not data
+            buffer += text.decode(data, final=eof)
+            continue
+        position = end
+        separated = False
+        yield in_array, value
+
+    if in_array:
+        raise json.JSONDecodeError('Unterminated array', buffer, position)
 
 
 def dump(iterator):
@@ -143,6 +304,74 @@ def dump(iterator):
     return json.dumps(list(iterator))
 
 
+def dump_stream(iterator, stream):
+    """Write JSON array from iterator into a binary file object.
+
+    Items are serialized one at a time and the output is the same as from
+    :func:`dump` followed by a new line.
+
+    .. versionadded:: 1.8.0
+    """
+    stream.write(b'[')
+    for position, item in enumerate(iterator):
+        if position:
+            stream.write(b', ')
+        stream.write(json.dumps(item).encode('utf-8'))
+    stream.write(b']\n')
+
+
+dump.__stream__ = dump_stream
+
+
+def load_jsonl(stream):
+    """Load JSON Lines from bytestream and yield records.
+
+    .. versionadded:: 1.8.0
+    """
+    from .compression import open_input
+
+    for line in open_input(stream):
+        if line.strip():
+            yield json.loads(line.decode('utf-8'))
+
+
+def _jsonl_reader(path, **kwargs):
+    """Open :class:`~dojson.offsets.JSONLinesReader` of a file."""
+    from .offsets import JSONLinesReader
+
+    return JSONLinesReader(path, **kwargs)
+
+
+load_jsonl.__reader__ = _jsonl_reader
+
+
+def dump_jsonl(iterator):
+    """Dump JSON Lines from iterator, one item per line.
+
+    .. versionadded:: 1.8.0
+    """
+    return '\n'.join(json.dumps(item) for item in iterator)
+
+
+def dump_jsonl_stream(iterator, stream, flush_interval=100):
+    """Write JSON Lines from iterator into a binary file object.
+
+    Items are serialized directly including grouped values and tuples, the
+    stream is flushed after every ``flush_interval`` items so that the
+    output can be consumed while it is written.
+
+    .. versionadded:: 1.8.0
+    """
+    for position, item in enumerate(iterator, 1):
+        stream.write(json.dumps(item).encode('utf-8') + b'\n')
+        if position % flush_interval == 0:
+            stream.flush()
+    stream.flush()
+
+
+dump_jsonl.__stream__ = dump_jsonl_stream
+
+
 def deprecated(explanation):
     """Decorate as deprecated."""
     def decorator(f):
@@ -213,28 +442,26 @@ class GroupableOrderedDict(OrderedDict):
                 else:
                     values = iteritems(values)
 
+            groups = {}
             for key, value in values:
-                if key not in new:
-                    OrderedDict.__setitem__(new, key, [])
-                v = []
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = []
                 if isinstance(value, (tuple, list)):
-                    for item in value:
-                        v.append(item)
-                        ordering.append(key)
-                elif isinstance(value, dict):
-                    if '__order__' in value:
-                        value = cls(value)
-                    v.append(value)
-                    ordering.append(key)
+                    group.extend(value)
+                    ordering.extend([key] * len(value))
                 else:
-                    v.append(value)
+                    # Nested instances are immutable and need no copy.
+                    if isinstance(value, dict) and \
+                            not isinstance(value, cls) and \
+                            '__order__' in value:
+                        value = cls(value)
+                    group.append(value)
                     ordering.append(key)
 
-                OrderedDict.__getitem__(new, key).extend(v)
-
-        # Immutable...
-        for key, value in dict.items(new):
-            OrderedDict.__setitem__(new, key, tuple(value))
+            # Immutable...
+            for key, group in groups.items():
+                OrderedDict.__setitem__(new, key, tuple(group))
 
         OrderedDict.__setitem__(new, '__order__', tuple(ordering))
         return new
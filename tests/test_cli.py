@@ -5,10 +5,14 @@
 
 from __future__ import absolute_import
 
+import bz2
 import codecs
+import gzip
 import importlib.resources
+import lzma
 import os
 
+import mock
 import pytest
 import simplejson as json
 from click.testing import CliRunner
@@ -80,6 +84,115 @@ def test_xml_to_marc21_to_xml(file_name):
     assert result.exit_code == 0
 
 
+def test_cli_jobs():
+    """Test that worker processes produce the same output."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    schema = str(importlib.resources.files('dojson.contrib.marc21.schemas') / 'marc21/bibliographic/bd-v1.0.2.json')
+    args = [
+        '-i', path, '-l', 'marcxml', 'do', 'marc21', 'validate', schema,
+        'schema', '/schema.json', 'missing', 'marc21',
+    ]
+
+    runner = CliRunner()
+    expect = runner.invoke(cli.cli, args[:-2] + ['do', 'to_marc21'])
+    result = runner.invoke(cli.cli, ['--jobs', '2'] + args[:-2] + [
+        'do', 'to_marc21'
+    ])
+    assert result.exit_code == expect.exit_code == 0, result.exception
+    assert result.output == expect.output
+
+    # Stages run in the workers parsing the input, no other pool is used.
+    with mock.patch('dojson.cli.Executor') as executor:
+        result = runner.invoke(cli.cli, ['--jobs', '2'] + args[:-2] + [
+            'do', 'to_marc21'
+        ])
+    assert result.exit_code == 0, result.exception
+    assert result.output == expect.output
+    assert not executor.called
+
+    # Commands without a stage run in the main process.
+    result = runner.invoke(cli.cli, ['--jobs', '2'] + args)
+    assert result.exit_code == 1
+    assert '$schema' in result.output.split(', ')
+
+
+def test_cli_jsonl(tmpdir):
+    """Test converting JSON Lines."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    output = str(tmpdir.join('records.jsonl'))
+    runner = CliRunner()
+    expect = runner.invoke(cli.cli, ['-i', path, '-l', 'marcxml', 'do', 'marc21'])
+    result = runner.invoke(cli.cli, [
+        '-i', path, '-l', 'marcxml', '-d', 'jsonl', 'do', 'marc21'
+    ])
+    assert result.exit_code == 0, result.exception
+    lines = result.output.splitlines()
+    assert [json.loads(line) for line in lines] == json.loads(expect.output)
+
+    with open(output, 'w') as stream:
+        stream.write(result.output)
+    result = runner.invoke(cli.cli, [
+        '-i', output, '-l', 'jsonl', '-d', 'jsonl', 'schema', '/s.json'
+    ])
+    assert result.exit_code == 0, result.exception
+    assert json.loads(result.output)['$schema'] == '/s.json'
+
+
+def test_cli_compression(tmpdir):
+    """Test compressed input and output."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    compressed = str(tmpdir.join('test_1.xml.gz'))
+    with open(path, 'rb') as source, gzip.open(compressed, 'wb') as target:
+        target.write(source.read())
+
+    runner = CliRunner()
+    expect = runner.invoke(cli.cli, ['-i', path, '-l', 'marcxml', 'do', 'marc21'])
+    for jobs in ('1', '2'):
+        result = runner.invoke(cli.cli, [
+            '-j', jobs, '-i', compressed, '-l', 'marcxml', 'do', 'marc21'
+        ])
+        assert result.exit_code == 0, result.exception
+        assert result.output == expect.output
+
+    output = str(tmpdir.join('records.json.xz'))
+    result = runner.invoke(cli.cli, [
+        '-i', compressed, '-l', 'marcxml', '-o', output, 'do', 'marc21'
+    ])
+    assert result.exit_code == 0, result.exception
+    assert result.output == ''
+    with lzma.open(output) as stream:
+        assert stream.read().decode('utf-8') == expect.output
+
+    output = str(tmpdir.join('records.mrc'))
+    result = runner.invoke(cli.cli, [
+        '-i', compressed, '-l', 'marcxml', '-d', 'marcxml', '-o', output,
+        '--compress', 'bz2', 'do', 'marc21', 'do', 'to_marc21'
+    ])
+    assert result.exit_code == 0, result.exception
+    with bz2.open(output) as stream:
+        assert stream.read().startswith(b"<?xml version='1.0'")
+
+
+def test_cli_index(tmpdir):
+    """Test writing indexes of input files."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    index_path = str(tmpdir.join('test_1.idx'))
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, [
+        '-i', path, '-l', 'marcxml', 'index', '-o', index_path
+    ])
+    assert result.exit_code == 0, result.exception
+    assert result.output == 'Indexed 1 records in {0}\n'.format(index_path)
+    assert os.path.exists(index_path)
+
+    result = runner.invoke(cli.cli, ['-i', path, 'index'])
+    assert result.exit_code == 2
+    assert 'does not support indexing' in result.output
+
+    result = runner.invoke(cli.cli, ['-l', 'marcxml', 'index'])
+    assert result.exit_code == 2
+
+
 @pytest.mark.parametrize('file_name', [
     'authority/ad01x09x.xml',
     'authority/ad1xx.xml',
@@ -159,6 +272,13 @@ def test_cli_do_marc21_from_xml():
         )
         assert 0 == result.exit_code
 
+        result = runner.invoke(
+            cli.cli,
+            ['-j', '2', '-i', 'record.xml', '-l', 'marcxml', 'do', 'marc21']
+        )
+        assert 0 == result.exit_code, result.exception
+        assert expected == json.loads(result.output)
+
 
 def test_cli_do_marc21_from_xml_unknown_fields():
     """Test MARC21 loading from XML containing unknown fields."""
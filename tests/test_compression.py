@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test suite for DoJSON compressed streams."""
+
+import bz2
+import gzip
+import io
+import lzma
+
+import pytest
+
+from dojson.compression import detect, open_input, open_output
+from dojson.utils import load
+
+DATA = b'[{"a": 1}, {"b": 2}]'
+
+
+class Pipe(io.RawIOBase):
+    """Stream that can be neither peeked nor seeked."""
+
+    def __init__(self, data, name=None):
+        self._data = io.BytesIO(data)
+        if name is not None:
+            self.name = name
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._data.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+@pytest.mark.parametrize('compression,compress', [
+    ('gzip', gzip.compress),
+    ('bz2', bz2.compress),
+    ('xz', lzma.compress),
+])
+def test_open_input(compression, compress):
+    """Test detecting and decompressing input."""
+    data = compress(DATA)
+    assert detect(data[:6]) == compression
+    assert open_input(io.BytesIO(data)).read() == DATA
+    assert open_input(io.BufferedReader(Pipe(data))).read() == DATA
+    assert list(load(io.BytesIO(data))) == [{'a': 1}, {'b': 2}]
+
+    extension = {'gzip': 'gz'}.get(compression, compression)
+    assert detect(name='records.json.' + extension) == compression
+    assert open_input(Pipe(data, 'records.' + extension)).read() == DATA
+    assert open_input(Pipe(data)).read() == data
+
+    stream = io.BytesIO()
+    output = open_output(stream, compression)
+    output.write(DATA)
+    output.close()
+    assert not stream.closed
+    assert open_input(io.BytesIO(stream.getvalue())).read() == DATA
+
+
+def test_uncompressed():
+    """Test that other input is returned as it is."""
+    stream = io.BytesIO(DATA)
+    assert open_input(stream) is stream
+    assert stream.tell() == 0
+    assert detect(b'', 'records.gz') is None
+    assert detect(name='records.json') is None
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test suite for DoJSON binary MARC 21."""
+
+import io
+import os
+
+from click.testing import CliRunner
+
+from dojson import cli
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.marc21.iso2709 import (
+    LazyRecord,
+    Reader,
+    create_record,
+    load,
+)
+from dojson.contrib.marc21.utils import create_record as create_marcxml
+from dojson.offsets import OffsetIndex
+
+MARCXML = u"""<record>
+  <leader>{leader}</leader>
+  <controlfield tag="001">123</controlfield>
+  <controlfield tag="005"></controlfield>
+  <datafield tag="100" ind1="1" ind2=" ">
+    <subfield code="a">Müller, Jürgen</subfield>
+  </datafield>
+  <datafield tag="245" ind1="1" ind2="0">
+    <subfield code="a">Title</subfield>
+    <subfield code="B"></subfield>
+    <subfield code="c">Author</subfield>
+  </datafield>
+  <datafield tag="500" ind1=" " ind2=" ">
+    <subfield code="a">Note</subfield>
+  </datafield>
+</record>"""
+
+
+def iso2709(fields, encoding='utf-8'):
+    """Return ISO 2709 record with given fields."""
+    directory = b''
+    data = b''
+    for tag, value in fields:
+        value = value.encode(encoding) + b'\x1e'
+        directory += '{0}{1:04d}{2:05d}'.format(
+            tag, len(value), len(data)
+        ).encode('ascii')
+        data += value
+    directory += b'\x1e'
+    base = 24 + len(directory)
+    length = base + len(data) + 1
+    leader = '{0:05d}nam a22{1:05d} a 4500'.format(length, base)
+    return leader.encode('ascii') + directory + data + b'\x1d'
+
+
+RECORD = iso2709([
+    ('001', '123'),
+    ('005', ''),
+    ('100', '1 \x1faMüller, Jürgen'),
+    ('245', '10\x1faTitle\x1fB\x1fcAuthor'),
+    ('500', '  \x1faNote'),
+])
+
+
+EXPECTED = create_marcxml(MARCXML.format(leader=RECORD[:24].decode('ascii')))
+
+
+def test_create_record():
+    """Test that binary records match MARCXML records."""
+    record = create_record(RECORD)
+    assert list(record.items()) == list(EXPECTED.items())
+    assert record['__order__'] == EXPECTED['__order__']
+
+    record = create_record(RECORD, keep_singletons=False)
+    assert '005' not in record
+    assert record['24510'] == {'a': 'Title', 'c': 'Author'}
+
+
+def test_load_encoding():
+    """Test streaming records in other encodings."""
+    data = iso2709([('100', '1 \x1faMüller')], encoding='latin-1')
+    stream = io.BytesIO((RECORD + b'\n') * 3 + data)
+    records = list(load(stream, encoding='latin-1'))
+    assert len(records) == 4
+    assert records[3]['1001_'] == {'a': 'Müller'}
+    assert records[0]['1001_'] == {'a': 'MÃ¼ller, JÃ¼rgen'}
+
+    stream = io.BytesIO(RECORD * 3)
+    assert [marc21.do(record) for record in load(stream)] == [
+        marc21.do(EXPECTED)
+    ] * 3
+
+
+def test_cli_load():
+    """Test loading binary MARC from the command line."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('records.mrc', 'wb') as stream:
+            stream.write(RECORD * 2)
+
+        result = runner.invoke(
+            cli.cli, ['-i', 'records.mrc', '-l', 'marc', 'do', 'marc21']
+        )
+        assert result.exit_code == 0, result.exception
+        assert 'Müller' in result.output or 'M\\u00fcller' in result.output
+
+
+def test_lazy_record():
+    """Test that lazy records behave like decoded records."""
+    data = iso2709([
+        ('245', '10\x1faTitle'),
+        ('001', '123'),
+        ('500', '  \x1faOne'),
+        ('500', '  \x1faTwo'),
+    ])
+    record = LazyRecord(b'\n' + data, offset=1)
+    expected = create_record(data)
+    assert record['__order__'] == expected['__order__']
+    assert list(record.items()) == list(expected.items())
+    assert record.decode() == expected
+    assert list(record.iteritems()) == list(expected.iteritems())
+    assert list(record.iteritems(repeated=True)) == list(
+        expected.iteritems(repeated=True)
+    )
+    assert record['500__'] == ({'a': 'One'}, {'a': 'Two'})
+    assert '650__' not in record
+    assert marc21.do(record) == marc21.do(expected)
+
+
+def test_reader(tmpdir):
+    """Test random access to records with a saved index."""
+    path = str(tmpdir.join('records.mrc'))
+    other = iso2709([('001', '456 '), ('500', '  \x1faOther')])
+    with open(path, 'wb') as stream:
+        stream.write(RECORD + b'\n' + other + RECORD)
+
+    with Reader(path) as reader:
+        assert len(reader) == 3
+        assert reader.get('456')['500__'] == {'a': 'Other'}
+        assert reader.get('789') is None
+        assert reader.index.find('123') == 0
+        assert marc21.do(reader[2]) == marc21.do(EXPECTED)
+        assert [record['001'] for record in reader] == ['123', '456 ', '123']
+    assert os.path.exists(path + '.idx')
+
+    index = OffsetIndex.load(path + '.idx', OffsetIndex.file_stat(path))
+    assert index[1] == (len(RECORD) + 1, len(RECORD) + 1 + len(other))
+    assert index.find('456') == 1
+
+    # Changed files are indexed again.
+    with open(path, 'wb') as stream:
+        stream.write(other)
+    assert OffsetIndex.load(
+        path + '.idx', OffsetIndex.file_stat(path)
+    ) is None
+    with Reader(path) as reader:
+        assert len(reader) == 1
+        assert reader.get('456') is not None
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test suite for DoJSON MARC-in-JSON."""
+
+import io
+import os
+
+import pytest
+import simplejson as json
+from click.testing import CliRunner
+
+from dojson import cli
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.marc21.marcjson import create_record
+from dojson.contrib.marc21.marcjson import load as load_marcjson
+from dojson.contrib.marc21.utils import create_record as create_marcxml
+from dojson.contrib.marc21.utils import load
+from dojson.contrib.to_marc21.marcjson import dump_record, dump_stream, dumps
+
+DATA = os.path.join(os.path.dirname(__file__), 'data')
+
+RECORD = {
+    'leader': '00000nam a2200000 a 4500',
+    'fields': [
+        {'001': '123'},
+        {'005': ''},
+        {'100': {'ind1': '1', 'ind2': ' ', 'subfields': [
+            {'a': 'Müller, Jürgen'},
+        ]}},
+        {'245': {'ind1': '1', 'ind2': '0', 'subfields': [
+            {'a': 'Title'}, {'B': ''}, {'c': 'Author'},
+        ]}},
+        {'500': {'ind1': ' ', 'ind2': ' ', 'subfields': [{'a': 'Note'}]}},
+    ],
+}
+
+MARCXML = u"""<record>
+  <leader>00000nam a2200000 a 4500</leader>
+  <controlfield tag="001">123</controlfield>
+  <controlfield tag="005"></controlfield>
+  <datafield tag="100" ind1="1" ind2=" ">
+    <subfield code="a">Müller, Jürgen</subfield>
+  </datafield>
+  <datafield tag="245" ind1="1" ind2="0">
+    <subfield code="a">Title</subfield>
+    <subfield code="B"></subfield>
+    <subfield code="c">Author</subfield>
+  </datafield>
+  <datafield tag="500" ind1=" " ind2=" ">
+    <subfield code="a">Note</subfield>
+  </datafield>
+</record>"""
+
+
+def test_create_record():
+    """Test that MARC-in-JSON records match MARCXML records."""
+    record = create_record(RECORD)
+    expected = create_marcxml(MARCXML)
+    assert list(record.items()) == list(expected.items())
+
+    record = create_record(RECORD, keep_singletons=False)
+    assert '005' not in record
+    assert record['24510'] == {'a': 'Title', 'c': 'Author'}
+
+
+@pytest.mark.parametrize('data', [
+    json.dumps(RECORD),
+    json.dumps([RECORD, RECORD]),
+    json.dumps(RECORD) + '\n' + json.dumps(RECORD) + '\n',
+])
+def test_load(data):
+    """Test loading single records, arrays and lines."""
+    records = list(load_marcjson(io.BytesIO(data.encode('utf-8'))))
+    assert records
+    assert all(record == create_record(RECORD) for record in records)
+
+
+@pytest.mark.parametrize('file_name', ['test_1.xml', 'test_6.xml'])
+def test_roundtrip(file_name):
+    """Test that records survive dumping and loading."""
+    with open(os.path.join(DATA, file_name), 'rb') as stream:
+        records = list(load(stream))
+
+    data = dumps(records)
+    assert json.loads(data)[0].get('leader') == records[0].get('leader')
+    loaded = list(load_marcjson(io.BytesIO(data.encode('utf-8'))))
+    assert loaded == records
+    assert [marc21.do(record) for record in loaded] == [
+        marc21.do(record) for record in records
+    ]
+
+    stream = io.BytesIO()
+    dump_stream(iter(records), stream)
+    assert stream.getvalue() == data.encode('utf-8') + b'\n'
+
+
+def test_dump_record():
+    """Test dumping a single record."""
+    expected = json.loads(json.dumps(RECORD).replace('"B"', '"b"'))
+    assert dump_record(create_record(RECORD)) == expected
+    assert json.loads(dumps(create_record(RECORD))) == expected
+    assert dump_record({'245__': {'a': 'Title'}}) == {'fields': [
+        {'245': {'ind1': ' ', 'ind2': ' ', 'subfields': [{'a': 'Title'}]}},
+    ]}
+
+
+def test_cli(tmpdir):
+    """Test converting MARC-in-JSON from the command line."""
+    path = str(tmpdir.join('records.json'))
+    with open(path, 'w') as stream:
+        json.dump([RECORD], stream)
+
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, [
+        '-i', path, '-l', 'marcjson', '-d', 'marcjson',
+        'do', 'marc21', 'do', 'to_marc21',
+    ])
+    assert result.exit_code == 0, result.exception
+    assert json.loads(result.output)[0]['fields'][3]['245'] == {
+        'ind1': '1', 'ind2': '0',
+        'subfields': [{'a': 'Title'}, {'b': ''}, {'c': 'Author'}],
+    }
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test suite for DoJSON binary MARC 21 dumper."""
+
+import io
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from dojson import cli
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.marc21.iso2709 import load as load_iso2709
+from dojson.contrib.marc21.utils import load
+from dojson.contrib.to_marc21 import to_marc21
+from dojson.contrib.to_marc21.iso2709 import dump_record, dump_stream, dumps
+
+DATA = os.path.join(os.path.dirname(__file__), 'data')
+
+
+def without_leader(record):
+    """Return record items and order except the leader."""
+    return [
+        item for item in record.items() if item[0] not in ('leader', '__order__')
+    ], [key for key in record['__order__'] if key != 'leader']
+
+
+@pytest.mark.parametrize('file_name', [
+    'handcrafted/bdleader.xml',
+    'library_of_congress/bd1xx.xml',
+    'library_of_congress/bd5xx.xml',
+    'test_1.xml',
+])
+def test_roundtrip(file_name):
+    """Test that binary records load back into the same records."""
+    records = list(load(os.path.join(DATA, file_name)))
+    data = dumps(to_marc21.do(marc21.do(record)) for record in records)
+
+    loaded = list(load_iso2709(io.BytesIO(data)))
+    assert [without_leader(r) for r in loaded] == [
+        without_leader(create) for create in records
+    ]
+    for record, original in zip(loaded, records):
+        leader = original.get('leader')
+        if leader:
+            assert record['leader'][5:9] == leader[5:9]
+            assert record['leader'][9] == 'a'
+            assert int(record['leader'][:5]) == len(dump_record(
+                to_marc21.do(marc21.do(original))
+            ))
+
+
+def test_dump_record():
+    """Test record length, base address and directory."""
+    data = dump_record({
+        '001': '1',
+        '245__': {'a': 'Tïtle', 'b': ['One', 'Two']},
+    })
+    assert data == (
+        b'00073nam a2200049uu 4500'
+        b'001000200000'
+        b'245002100002'
+        b'\x1e1\x1e'
+        b'  \x1faT\xc3\xaftle\x1fbOne\x1fbTwo\x1e\x1d'
+    )
+    assert len(data) == 73
+
+    with pytest.raises(ValueError):
+        dump_record({'500__': {'a': 'x' * 10000}})
+
+
+def test_dump_stream():
+    """Test writing records to a file object."""
+    records = [to_marc21.do(marc21.do(record))
+               for record in load(os.path.join(DATA, 'test_1.xml'))]
+    stream = io.BytesIO()
+    dump_stream(iter(records), stream)
+    assert stream.getvalue() == dumps(records)
+
+
+def test_cli_dump():
+    """Test dumping binary MARC from the command line."""
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, [
+        '-i', os.path.join(DATA, 'test_1.xml'), '-l', 'marcxml',
+        '-d', 'marc', 'do', 'marc21', 'do', 'to_marc21',
+    ])
+    assert result.exit_code == 0, result.exception
+    records = list(load_iso2709(io.BytesIO(result.stdout_bytes)))
+    assert len(records) == len(list(load(os.path.join(DATA, 'test_1.xml'))))
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test suite for DoJSON direct MARCXML serializer."""
+
+import io
+import os
+
+import pytest
+
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.marc21.utils import load
+from dojson.contrib.to_marc21 import marcxml, to_marc21, utils
+
+DATA = os.path.join(os.path.dirname(__file__), 'data')
+
+RECORD = {
+    'leader': 'a&b',
+    '001': 'x<y>\r',
+    '24510': {'a': ['q"\'\n\t&', ''], 'b': 'Müller \U0001f600'},
+    '500__': [{'a': '1'}, 'plain', {}],
+    '99"&\t': 'v',
+}
+
+
+@pytest.mark.parametrize('pretty_print', [True, False])
+@pytest.mark.parametrize('file_name', [
+    'test_1.xml',
+    'test_6.xml',
+    'test_cds_marc21.xml',
+    'handcrafted/bd6xx.xml',
+])
+def test_same_as_lxml(file_name, pretty_print):
+    """Test that output is the same as from lxml."""
+    records = list(load(os.path.join(DATA, file_name)))
+    translated = [to_marc21.do(marc21.do(record)) for record in records]
+    for data in (records, translated, records[0], [], RECORD, [RECORD]):
+        assert marcxml.dumps(data, pretty_print=pretty_print) == \
+            utils.dumps(data, pretty_print=pretty_print)
+
+    stream = io.BytesIO()
+    marcxml.dump_stream(iter(translated), stream, pretty_print=pretty_print)
+    assert stream.getvalue() == utils.dumps(
+        translated, pretty_print=pretty_print
+    )
+
+
+@pytest.mark.parametrize('value,exception', [
+    ('\x01', ValueError),
+    ('\ufffe', ValueError),
+    ('\ud800', UnicodeEncodeError),
+])
+def test_invalid_values(value, exception):
+    """Test that values refused by lxml are refused too."""
+    for module in (utils, marcxml):
+        with pytest.raises(exception):
+            module.dumps([{'24510': {'a': value}}])
@@ -3,6 +3,8 @@
 
 """Test suite for DoJSON to_marc21."""
 
+import gzip
+import io
 import os
 
 import pytest
@@ -11,8 +13,15 @@ from lxml import etree
 from lxml.etree import _Element
 from test_core import RECORD_SIMPLE
 
+from dojson.contrib.marc21 import marc21
 from dojson.contrib.marc21.utils import load
-from dojson.contrib.to_marc21.utils import dumps, dumps_etree
+from dojson.contrib.to_marc21 import to_marc21
+from dojson.contrib.to_marc21.utils import (
+    MARCXMLWriter,
+    dump_stream,
+    dumps,
+    dumps_etree,
+)
 from dojson.utils import entry_points
 
 
@@ -66,3 +75,46 @@ def test_output_type_from_dumps_etree():
     # it should not generate a TypeError exception
     assert isinstance(output1, _Element)
     assert isinstance(output2, _Element)
+
+
+@pytest.mark.parametrize('pretty_print', [True, False])
+@pytest.mark.parametrize('count', [0, 1, 3])
+def test_dump_stream(count, pretty_print):
+    """Test that streaming dump produces the same output."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    records = [to_marc21.do(marc21.do(record)) for record in load(path)]
+    records = (records * count)[:count]
+
+    stream = io.BytesIO()
+    dump_stream(iter(records), stream, pretty_print=pretty_print)
+    assert stream.getvalue() == dumps(records, pretty_print=pretty_print)
+
+    stream = io.BytesIO()
+    record = records[0] if records else {}
+    dump_stream(record, stream, pretty_print=pretty_print)
+    assert stream.getvalue() == dumps(record, pretty_print=pretty_print)
+
+
+def test_marcxml_writer():
+    """Test writing records as they come into a compressed stream."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    record = to_marc21.do(marc21.do(next(load(path))))
+
+    stream = io.BytesIO()
+    with MARCXMLWriter(stream) as writer:
+        assert stream.getvalue() == b''
+        writer.write(record)
+        assert stream.getvalue().endswith(b'</record>')
+        writer.write(record)
+    assert writer.count == 2
+    assert stream.getvalue() == dumps([record, record])
+    writer.close()
+    assert stream.getvalue() == dumps([record, record])
+
+    stream = io.BytesIO()
+    with gzip.GzipFile(fileobj=stream, mode='wb') as compressed:
+        with MARCXMLWriter(compressed, pretty_print=False) as writer:
+            writer.write(record)
+    assert gzip.decompress(stream.getvalue()) == dumps(
+        [record], pretty_print=False
+    )
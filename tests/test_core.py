@@ -5,17 +5,26 @@
 
 import os
 
+import mock
+import pytest
 import simplejson as json
 from lxml import etree, objectify
 
 import dojson
 from dojson._compat import BytesIO
 from dojson.contrib.marc21 import marc21
-from dojson.contrib.marc21.utils import create_record, load, split_stream
+from dojson.contrib.marc21.utils import (
+    create_record,
+    load,
+    split_blob,
+    split_buffer,
+    split_stream,
+)
 from dojson.contrib.to_marc21 import to_marc21
 from dojson.contrib.to_marc21.utils import dumps
-from dojson.errors import IgnoreItem
-from dojson.utils import flatten, for_each_value, ignore_value
+from dojson.errors import IgnoreItem, IgnoreKey, MissingRule
+from dojson.overdo import CachedIndex, Index, OverlayIndex, TableIndex
+from dojson.utils import IGNORE_ITEM, flatten, for_each_value, ignore_value
 
 RECORD = """<record>
   <controlfield tag="001">17575</controlfield>
@@ -172,6 +181,370 @@ def test_index_creation():
     assert ('247__', '247') == data['247']
 
 
+def test_do_mapping_without_order():
+    """Test that mappings with ``iteritems`` need not be grouped."""
+    overdo = dojson.Overdo()
+
+    @overdo.over('247', '^247..')
+    def match_247(self, key, value):
+        return value
+
+    class Blob(dict):
+
+        def iteritems(self):
+            return iter(self.items())
+
+    assert {'247': 'T'} == overdo.do(Blob({'247__': 'T'}))
+
+
+def test_table_index_first_match_wins():
+    """Test that table index respects rule registration order."""
+    rules = [
+        ('^100[0_31].', 'first'),
+        ('^100..', 'second'),
+        ('^1.0..', 'irregular'),
+        ('^110[0-2]_$', 'range'),
+        ('^001', 'control'),
+        ('__order__', 'order'),
+    ]
+    index = TableIndex(rules)
+    expected = Index(rules)
+
+    for key in ('1000_', '10022', '1102_', '110__', '1102_\n', '1102__',
+                '001', '0011', '00', '__order__', '__order__x', '', '999__'):
+        assert expected.lookup(key) == index.lookup(key), key
+        assert expected.query(key) == index.query(key), key
+
+    index = TableIndex([('^1.0..', 'irregular'), ('^100..', 'table')])
+    assert 'irregular' == index.query('100__')
+
+
+def test_table_index_literal_rules():
+    """Test that anchored literal rules are served from a dictionary."""
+    rules = [
+        ('^title.*$', 'irregular'),
+        ('^title_statement$', 'title'),
+        ('^tit', 'prefix'),
+        ('^title_statement$', 'duplicate'),
+        ('^leader$', 'leader'),
+    ]
+    index = TableIndex(rules)
+    expected = Index(rules)
+
+    assert {'leader', 'title_statement'} <= set(index._literals)
+    for key in ('title_statement', 'title_statement\n', 'title', 'tit',
+                'leader', 'leader_', 'leade', 'unknown'):
+        assert expected.lookup(key) == index.lookup(key), key
+
+    to_marc21.build()
+    index = TableIndex(to_marc21.rules)
+    expected = Index(to_marc21.rules)
+
+    assert len(index._literals) > 400 and not index._fallback
+    for regex, _ in to_marc21.rules:
+        key = regex.strip('^$')
+        assert expected.lookup(key) == index.lookup(key), key
+
+
+def test_table_index_marc21_rules():
+    """Test table index on MARC21 rules against the regex index."""
+    marc21.build()
+    index = TableIndex(marc21.rules)
+    expected = Index(marc21.rules)
+
+    assert not index._fallback
+    for tag in range(1000):
+        for indicators in ('__', '0_', '10', '47', '7 ', '#9'):
+            key = '{0:03d}{1}'.format(tag, indicators)
+            assert expected.lookup(key) == index.lookup(key), key
+    for key in ('leader', '__order__', '001', '005'):
+        assert expected.lookup(key) == index.lookup(key), key
+
+
+def test_index_extend():
+    """Test appending rules to built indexes."""
+    rules = [('^24[57]..', 'a'), ('^1.0..', 'b'), ('^100..', 'c'),
+             ('^title$', 'd'), ('^tit', 'e'), ('^1..0.', 'f')]
+    keys = ('245__', '247__', '100__', '110__', '1000_', 'title', 'titles',
+            '999__')
+
+    for index_class in (Index, TableIndex):
+        expected = index_class(rules)
+        index = index_class(rules[:1], branch_size=2)
+        index.extend(rules[1:2])
+        index.extend(rules[2:5])
+        index.extend(rules[5:])
+
+        assert rules == index.rules
+        for key in keys:
+            assert expected.lookup(key) == index.lookup(key), key
+
+    index = CachedIndex(TableIndex(rules[:1]))
+    assert index.query('100__') is None
+    assert 'a' == index.query('245__')
+    index.extend(rules[1:])
+    assert 'b' == index.query('100__')
+    assert 'a' == index.query('245__')
+    assert (1, 3) == (index.hits, index.misses)
+
+
+def test_overdo_extends_built_index():
+    """Test that registering a rule does not rebuild the index."""
+    overdo = dojson.Overdo()
+
+    @overdo.over('247', '^247..')
+    def match_247(self, key, value):
+        return value
+
+    assert {'247': '247'} == overdo.do({'0247_': '024', '247__': '247'})
+    index = overdo.index
+
+    @overdo.over('024', '^024..')
+    def match_024(self, key, value):
+        return value
+
+    assert index is overdo.index
+    assert {'024': '024', '247': '247'} == overdo.do(
+        {'0247_': '024', '247__': '247'}
+    )
+
+
+def test_overlay_index():
+    """Test that derived rules are layered over the base index."""
+    base = dojson.Overdo()
+
+    @base.over('base', '^2....')
+    def match_base(self, key, value):
+        return value
+
+    derived = dojson.Overdo(bases=[base])
+
+    @derived.over('derived', '^2....', '^3....')
+    def match_derived(self, key, value):
+        return value
+
+    @base.over('base', '^3....')
+    def match_base_later(self, key, value):
+        return value
+
+    assert {'base': '2', 'derived': '3'} == derived.do(
+        {'245__': '2', '300__': '3'}
+    )
+    assert isinstance(derived.index.index, OverlayIndex)
+    assert base.index is derived.index.index.layers[0][0]
+    assert {'base': '3'} == base.do({'300__': '3'})
+
+
+def test_cached_index():
+    """Test bounded lookup cache in front of an index."""
+    index = CachedIndex(TableIndex([('^245..', 'title')]), maxsize=2)
+
+    assert 'title' == index.query('245__')
+    assert 'title' == index.query('245__')
+    assert index.query('999__') is None
+    assert index.query('999__') is None
+    assert (2, 2) == (index.hits, index.misses)
+
+    # Least recently used key is evicted.
+    index.query('24510')
+    assert 2 == len(index)
+    assert index.query('999__') is None
+    assert 3 == index.hits
+    assert 'title' == index.query('245__')
+    assert 4 == index.misses
+
+    index.clear()
+    assert (0, 0, 0) == (len(index), index.hits, index.misses)
+
+
+def test_cached_index_invalidation():
+    """Test that registering a rule drops the lookup cache."""
+    overdo = dojson.Overdo(cache_size=10)
+
+    @overdo.over('247', '^247..')
+    def match_247(self, key, value):
+        return value
+
+    assert ['0247_'] == overdo.missing({'0247_': '024', '247__': '247'})
+    assert isinstance(overdo.index, CachedIndex)
+
+    @overdo.over('024', '^024..')
+    def match_024(self, key, value):
+        return value
+
+    assert [] == overdo.missing({'0247_': '024', '247__': '247'})
+
+    uncached = dojson.Overdo(cache_size=0)
+    uncached.build()
+    assert isinstance(uncached.index, TableIndex)
+
+
+def test_snapshot(tmpdir):
+    """Test saving and restoring a built index from a snapshot."""
+    blob = create_record(RECORD)
+    expected = marc21.do(blob)
+
+    overdo = dojson.Overdo(bases=[marc21], snapshot_dir=str(tmpdir))
+    overdo.build()
+    assert 1 == len(tmpdir.listdir())
+
+    restored = dojson.Overdo(bases=[marc21], snapshot_dir=str(tmpdir))
+    path = restored.snapshot_path()
+    assert str(tmpdir.listdir()[0]) == path
+
+    index = restored.load_snapshot(path)
+    assert index is not None
+    assert len(overdo.rules) == len(restored.rules)
+    restored.index = index
+    assert expected == restored.do(blob)
+
+    # Rules registered from a restored snapshot are not duplicated.
+    restored._collect_entry_points()
+    assert len(overdo.rules) == len(restored.rules)
+    assert restored.index is index
+
+
+def test_snapshot_not_importable(tmpdir):
+    """Test that local creators are not saved in snapshots."""
+    overdo = dojson.Overdo(snapshot_dir=str(tmpdir))
+
+    @overdo.over('247', '^247..')
+    def match_247(self, key, value):
+        return value
+
+    assert {'247': '247'} == overdo.do({'247__': '247'})
+    assert [] == tmpdir.listdir()
+
+
+def test_lazy_entry_points():
+    """Test loading rule modules only for processed tags."""
+    overdo = dojson.Overdo(entry_point_group='dojson.test', lazy=True)
+    loaded = []
+
+    class EntryPoint(object):
+
+        def __init__(self, name, regex):
+            self.name = name
+            self.regex = regex
+
+        def load(self):
+            loaded.append(self.name)
+            overdo.over(self.name, self.regex)(
+                lambda self, key, value: value
+            )
+
+    eps = [
+        EntryPoint('bd1xx', '^1....'),
+        EntryPoint('bd20x24x', '^24[05]..'),
+        EntryPoint('bdleader', '^leader'),
+        EntryPoint('custom', '^999..'),
+    ]
+
+    with mock.patch('dojson.overdo.entry_points', return_value=eps):
+        assert {'bd20x24x': 'T'} == overdo.do({'245__': 'T'})
+        assert ['custom', 'bd20x24x'] == loaded
+
+        assert ['500__'] == overdo.missing({'100__': 'N', '500__': 'S'})
+        assert {'bd1xx': 'N', 'bdleader': 'L', 'custom': 'C'} == overdo.do(
+            {'100__': 'N', 'leader': 'L', '999__': 'C'}
+        )
+        assert ['custom', 'bd20x24x', 'bd1xx', 'bdleader'] == loaded
+
+
+def test_lazy_entry_points_to_marc21():
+    """Test that lazy entry points are loaded for keys not being tags."""
+    from dojson.contrib.to_marc21.model import Underdo
+
+    overdo = Underdo(entry_point_group='dojson.test', lazy=True)
+    loaded = []
+
+    class EntryPoint(object):
+
+        def __init__(self, name, regex, tag):
+            self.name = name
+            self.regex = regex
+            self.tag = tag
+
+        def load(self):
+            loaded.append(self.name)
+            overdo.over(self.tag, self.regex)(
+                lambda self, key, value: {'a': value}
+            )
+
+    eps = [
+        EntryPoint('bd1xx', '^main_entry_personal_name$', '100'),
+        EntryPoint('bd20x24x', '^title_statement$', '245'),
+    ]
+
+    with mock.patch('dojson.overdo.entry_points', return_value=eps):
+        assert [] == overdo.missing({'title_statement': 'T'})
+        assert {'a': 'T'} == overdo.do({'title_statement': 'T'})['245__']
+        assert ['bd1xx', 'bd20x24x'] == loaded
+
+
+def test_lazy_entry_points_tags():
+    """Test that only tags of the same ten declare a range."""
+    overdo = dojson.Overdo(entry_point_group='dojson.test', lazy=True)
+    loaded = []
+
+    class EntryPoint(object):
+
+        def __init__(self, name, regex):
+            self.name = name
+            self.regex = regex
+
+        def load(self):
+            loaded.append(self.name)
+            overdo.over(self.name, self.regex)(
+                lambda self, key, value: value
+            )
+
+    eps = [
+        EntryPoint('ad260360', '^(260|360)..'),
+        EntryPoint('ad663666', '^66[3-6]..'),
+    ]
+
+    with mock.patch('dojson.overdo.entry_points', return_value=eps):
+        assert {} == overdo.do({'300__': 'S'})
+        assert [] == loaded
+
+        assert {'ad663666': 'R'} == overdo.do({'664__': 'R'})
+        assert ['ad663666'] == loaded
+
+        assert {'ad260360': 'T'} == overdo.do({'360__': 'T'})
+        assert ['ad663666', 'ad260360'] == loaded
+
+
+def test_conversion_plans():
+    """Test caching of conversion plans per key sequence."""
+    overdo = dojson.Overdo()
+
+    @overdo.over('247', '^247..')
+    def match_247(self, key, value):
+        return value
+
+    assert {'247': 'a'} == overdo.do({'0247_': '024', '247__': 'a'})
+    assert {'247': 'b'} == overdo.do({'0247_': '025', '247__': 'b'})
+    assert {'247': 'c'} == overdo.do({'247__': 'c', '0247_': '026'})
+    assert (1, 2) == (overdo.plans.hits, overdo.plans.misses)
+    step = overdo.plan(('247__', '0247_'))
+    assert (('247', match_247, False), None) == step
+
+    @overdo.over('024', '^024..')
+    @for_each_value
+    def match_024(self, key, value):
+        return value
+
+    assert 0 == len(overdo.plans)
+    assert {'024': ['024'], '247': 'a'} == overdo.do(
+        {'0247_': '024', '247__': 'a'}
+    )
+
+    uncached = dojson.Overdo(bases=[overdo], plan_cache_size=0)
+    assert {'024': ['024']} == uncached.do({'0247_': '024'})
+    assert uncached.plans is None
+
+
 def test_missing_fields():
     """Test missing fields."""
     overdo = dojson.Overdo()
@@ -301,6 +674,79 @@ def test_ignore_item_exception():
     assert overdo.do(source) == result
 
 
+def test_ignore_signals():
+    """Test ignoring keys and items without raising exceptions."""
+    overdo = dojson.Overdo()
+
+    @overdo.over('a', '^a')
+    @for_each_value
+    def match_a(self, key, value):
+        return value or IGNORE_ITEM
+
+    @overdo.over('b', '^b')
+    @flatten
+    @for_each_value
+    @ignore_value
+    def match_b(self, key, value):
+        return value
+
+    assert {'a': [1, 2], 'b': [3, 4]} == overdo.do(
+        {'a': [0, 1, None, 2], 'b': [[3], [4]]}
+    )
+    assert {'a': [1]} == overdo.do({'a': [1], 'b': [[3], None]})
+
+    ignored = []
+
+    def handler(exc, output, key, value):
+        assert isinstance(exc, (IgnoreKey, MissingRule))
+        ignored.append(key)
+
+    overdo.do({'b': None, 'c': 1}, exception_handlers={
+        IgnoreKey: handler, MissingRule: handler,
+    })
+    assert ['b', 'c'] == ignored
+
+    with pytest.raises(MissingRule):
+        overdo.do({'a': 1, 'c': 1}, ignore_missing=False)
+
+
+def test_do_many():
+    """Test translating a batch of blobs."""
+    overdo = dojson.Overdo()
+
+    @overdo.over('a', '^a')
+    def match_a(self, key, value):
+        return 10 // value
+
+    batch = overdo.do_many([{'a': 1}, {'a': 2, 'b': 3}, {'a': 5}])
+    assert [{'a': 10}, {'a': 5}, {'a': 2}] == list(batch)
+    assert (3, 0) == (batch.records, batch.errors)
+    assert batch.elapsed > 0
+
+    with pytest.raises(MissingRule):
+        list(overdo.do_many([{'b': 1}], ignore_missing=False))
+
+    failed = []
+    batch = overdo.do_many(
+        [{'a': 1}, {'a': 0}, {'a': 2}],
+        on_error=lambda position, blob, exc: failed.append((position, blob)),
+    )
+    assert [{'a': 10}, {'a': 5}] == list(batch)
+    assert (2, 1) == (batch.records, batch.errors)
+    assert [(1, {'a': 0})] == failed
+
+    with pytest.raises(ZeroDivisionError):
+        list(overdo.do_many([{'a': 0}]))
+
+
+def test_marc21_do_many():
+    """Test translating a batch of MARC21 records there and back."""
+    blobs = [create_record(record) for record in RECORDS.values()]
+    data = list(marc21.do_many(blobs))
+    assert [marc21.do(blob) for blob in blobs] == data
+    assert blobs == list(to_marc21.do_many(data))
+
+
 def test_marc21_loader():
     """Test MARC21 loader."""
     COLLECTION = '<collection>{0}{1}</collection>'.format(
@@ -323,6 +769,61 @@ def test_marc21_split_stream():
         next(generator), method='html').decode('utf-8') == RECORD_SIMPLE
 
 
+def test_marc21_split_blob():
+    """Test MARC21 split_blob() and split_buffer()."""
+    COLLECTION = u'<collection>{0}{1}</collection>'.format(
+        RECORD, RECORD_SIMPLE
+    )
+    assert list(split_blob(COLLECTION)) == [RECORD, RECORD_SIMPLE]
+
+    buffer = COLLECTION.replace('</record>', '</record><recordset/>', 1)
+    buffer = buffer.encode('utf-8')
+    assert [
+        buffer[start:end].decode('utf-8')
+        for start, end in split_buffer(buffer)
+    ] == [RECORD, RECORD_SIMPLE]
+
+
+def test_marc21_create_record_inputs():
+    """Test that create_record() gives the same record for all inputs."""
+    expected = create_record(etree.fromstring(RECORD))
+    assert create_record(RECORD) == expected
+    assert create_record(RECORD.encode('utf-8')) == expected
+    assert create_record(
+        b"<?xml version='1.0' encoding='UTF-8'?>" + RECORD.encode('utf-8')
+    ) == expected
+    assert create_record(RECORD, correct=True) == expected
+    assert create_record(b'not xml') == {}
+
+
+def test_marc21_create_record_declared_encoding():
+    """Test that declared encodings apply to bytes but not to text."""
+    marcxml = (u'<?xml version="1.0" encoding="ISO-8859-1"?>'
+               u'<record><controlfield tag="001">Caf\xe9</controlfield>'
+               u'</record>')
+    with pytest.raises(ValueError):
+        create_record(marcxml)
+    assert create_record(marcxml.encode('latin-1'))['001'] == u'Caf\xe9'
+
+
+def test_marc21_split_stream_clear():
+    """Test that split_stream() frees processed records."""
+    COLLECTION = u'<collection>{0}{1}{0}</collection>'.format(
+        RECORD, RECORD_SIMPLE
+    )
+    generator = split_stream(
+        BytesIO(COLLECTION.encode('utf-8')), clear=True
+    )
+    records = [next(generator) for _ in range(3)]
+    assert list(records[2].getparent()) == records[1:]
+    assert len(records[0]) == len(records[1]) == 0
+
+    records = list(split_stream(BytesIO(COLLECTION.encode('utf-8'))))
+    assert len(records[2].getparent()) == 3
+    assert etree.tostring(
+        records[0], method='html').decode('utf-8') == RECORD
+
+
 def test_marc21_records_over_single_line():
     """Test records over single line."""
 
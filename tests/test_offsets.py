@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test suite for DoJSON offset indexes."""
+
+import gzip
+import io
+
+import pytest
+import simplejson as json
+
+from dojson.contrib.marc21.utils import Reader, load
+from dojson.offsets import JSONLinesReader, OffsetIndex
+
+MARCXML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<marc:collection xmlns:marc="http://www.loc.gov/MARC21/slim">
+  <marc:record>
+    <marc:controlfield tag="001">1 &amp; 2</marc:controlfield>
+    <marc:datafield tag="245" ind1=" " ind2=" ">
+      <marc:subfield code="a">First</marc:subfield>
+    </marc:datafield>
+  </marc:record>
+  <marc:record>
+    <marc:datafield tag="245" ind1=" " ind2=" ">
+      <marc:subfield code="a">Second</marc:subfield>
+    </marc:datafield>
+  </marc:record>
+  <marc:record>
+    <marc:controlfield tag="001">3</marc:controlfield>
+  </marc:record>
+</marc:collection>
+"""
+
+
+def test_offset_index(tmpdir):
+    """Test saving and loading indexes."""
+    path = str(tmpdir.join('records.idx'))
+    index = OffsetIndex(stat=(10, 1))
+    index.append(0, 4, 'a')
+    index.append(4, 10, 'a')
+    index.append(10, 12)
+    index.save(path)
+
+    loaded = OffsetIndex.load(path, (10, 1))
+    assert len(loaded) == 3
+    assert loaded[1] == (4, 10)
+    assert loaded.find('a') == 0
+    assert loaded.find('b') is None
+    assert OffsetIndex.load(path, (10, 2)) is None
+    assert OffsetIndex.load(str(tmpdir.join('missing.idx'))) is None
+
+    with open(path, 'wb') as stream:
+        stream.write(b'cos\nsystem\n(S"exit 1"\ntR.')
+    assert OffsetIndex.load(path) is None
+
+
+def test_marcxml_reader(tmpdir):
+    """Test random access to MARC XML records."""
+    path = str(tmpdir.join('records.xml'))
+    with open(path, 'wb') as stream:
+        stream.write(MARCXML)
+
+    with Reader(path) as reader:
+        assert len(reader) == 3
+        assert reader.get('1 & 2')['245__'] == {'a': 'First'}
+        assert reader[1]['245__'] == {'a': 'Second'}
+        assert [record['001'] for record in reader[::2]] == ['1 & 2', '3']
+        assert list(reader) == list(load(io.BytesIO(MARCXML)))
+        assert reader.get('2') is None
+
+    assert OffsetIndex.load(
+        path + '.idx', OffsetIndex.file_stat(path)
+    ).find('3') == 2
+
+
+def test_jsonl_reader(tmpdir):
+    """Test random access to JSON Lines records."""
+    path = str(tmpdir.join('records.jsonl'))
+    records = [{'control_number': '1'}, {'001': '2'}, [], {'title': 'x'}]
+    with open(path, 'w') as stream:
+        for record in records:
+            stream.write(json.dumps(record) + '\n\n')
+
+    with JSONLinesReader(path, index_path=str(tmpdir.join('i'))) as reader:
+        assert list(reader) == records
+        assert reader.get('2') == {'001': '2'}
+        assert reader.index.keys == {'1': 0, '2': 1}
+    assert tmpdir.join('i').check()
+
+
+def test_compressed(tmpdir):
+    """Test that compressed files are refused."""
+    path = str(tmpdir.join('records.xml.gz'))
+    with gzip.open(path, 'wb') as stream:
+        stream.write(MARCXML)
+
+    with pytest.raises(ValueError) as excinfo:
+        Reader(path)
+    assert 'gzip' in str(excinfo.value)
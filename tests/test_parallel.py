@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test parallel translation."""
+
+import functools
+import os
+
+import pytest
+
+from dojson.contrib.marc21 import marc21
+from dojson.contrib.marc21.utils import load, load_parallel
+from dojson.errors import MissingRule
+from dojson.parallel import Executor, chain, resolve_rule, rule_reference, translate
+
+
+def test_rule_reference():
+    """Test rule references passed to worker processes."""
+    assert rule_reference(marc21) == 'marc21'
+    assert resolve_rule('marc21') is marc21
+    assert resolve_rule('dojson.contrib.marc21:marc21') is marc21
+    with pytest.raises(LookupError):
+        resolve_rule('unknown')
+
+
+def test_executor_order():
+    """Test that results keep the input order."""
+    blobs = [{'245__': {'a': 'Title {0}'.format(i)}} for i in range(50)]
+    with Executor(marc21, jobs=2, chunk_size=3, window=2) as executor:
+        results = list(executor.do(blobs))
+    assert results == [marc21.do(blob) for blob in blobs]
+
+
+def test_executor_errors():
+    """Test that errors are reported with the position of the blob."""
+    blobs = [{'245__': {'a': 'Title'}}, {'999__': {'a': 'Local'}}] * 3
+    errors = []
+
+    with Executor('marc21', jobs=2, chunk_size=2) as executor:
+        results = list(executor.do(
+            blobs, ignore_missing=False,
+            on_error=lambda *args: errors.append(args),
+        ))
+        assert len(results) == 3
+        assert [position for position, _, _ in errors] == [1, 3, 5]
+        assert all(isinstance(exc, MissingRule) for _, _, exc in errors)
+        assert errors[0][1] == blobs[1]
+
+        with pytest.raises(MissingRule):
+            list(executor.do(blobs, ignore_missing=False))
+
+
+def test_executor_map():
+    """Test applying chained functions in worker processes."""
+    function = functools.partial(chain, [
+        functools.partial(translate, 'marc21', False), len,
+    ])
+    blobs = [{'245__': {'a': 'Title'}}, {'999__': {'a': 'Local'}}]
+    errors = []
+
+    with Executor(jobs=2, chunk_size=1) as executor:
+        assert list(executor.map(
+            function, blobs, on_error=lambda *args: errors.append(args)
+        )) == [1]
+    assert errors[0][0] == 1
+    assert isinstance(errors[0][2], MissingRule)
+
+
+def test_load_parallel(tmpdir):
+    """Test loading MARC XML files in worker processes."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    assert list(load_parallel(path, jobs=2, chunk_size=2)) == list(load(path))
+
+    prefixed = tmpdir.join('prefixed.xml')
+    prefixed.write(
+        '<?xml version="1.0"?>\n'
+        '<marc:collection xmlns:marc="http://www.loc.gov/MARC21/slim">'
+        '<marc:record><marc:datafield tag="245" ind1=" " ind2=" ">'
+        '<marc:subfield code="a">Title</marc:subfield>'
+        '</marc:datafield></marc:record></marc:collection>'
+    )
+    assert list(load_parallel(str(prefixed), jobs=1)) == [
+        {'245__': {'a': 'Title'}}
+    ]
+
+    empty = tmpdir.join('empty.xml')
+    empty.write('')
+    assert list(load_parallel(str(empty), jobs=1)) == []
+
+
+def test_load_parallel_stages():
+    """Test applying stages to records in the loader workers."""
+    path = os.path.join(os.path.dirname(__file__), 'data', 'test_1.xml')
+    stages = [functools.partial(translate, 'marc21', True), len]
+    assert list(load_parallel(path, jobs=2, stages=stages)) == [
+        len(marc21.do(record)) for record in load(path)
+    ]
@@ -4,11 +4,23 @@
 """Test suite for DoJSON contrib MARC21 module."""
 
 import copy
+import io
 
 import pytest
 import simplejson as json
 
-from dojson.utils import GroupableOrderedDict, force_list, reverse_force_list
+from dojson.utils import (
+    GroupableOrderedDict,
+    dump,
+    dump_jsonl,
+    dump_jsonl_stream,
+    dump_stream,
+    force_list,
+    iter_json,
+    load,
+    load_jsonl,
+    reverse_force_list,
+)
 
 
 @pytest.fixture
@@ -159,6 +171,14 @@ def test_groupable_ordered_dict_recreate(god):
     assert god2 == god
 
 
+def test_groupable_ordered_dict_nested(god):
+    """Test that nested instances are not copied."""
+    outer = GroupableOrderedDict([('a', god), ('b', [god, {'c': 1}])])
+    assert outer['a'] is god
+    assert outer['b'][0] is god
+    assert outer['__order__'] == ('a', 'b', 'b')
+
+
 def test_groupable_ordered_dict_repr(god):
     """Test that a eval(repr(god)) == god."""
     assert eval(repr(god)) == god
@@ -178,3 +198,89 @@ def test_empty_elements():
 
 def test_force_list_roundtrips():
     assert reverse_force_list(force_list('foo')) == 'foo'
+
+
+@pytest.mark.parametrize('items', [[], [{'a': 1}], [{'a': 1}, {'b': [2]}]])
+def test_dump_stream(items):
+    """Test that streaming dump produces the same output."""
+    stream = io.BytesIO()
+    dump_stream(iter(items), stream)
+    assert stream.getvalue().decode('utf-8') == dump(items) + '\n'
+
+
+@pytest.mark.parametrize('data,expected', [
+    ('{"a": [1, 2]}', {'a': [1, 2]}),
+    (' [{"a": 1}, {"b": 2}] ', [{'a': 1}, {'b': 2}]),
+    ('[]', []),
+    ('', []),
+    ('{"a": 1}\n{"b": 2}\n', [{'a': 1}, {'b': 2}]),
+])
+def test_load(data, expected):
+    """Test loading objects and incrementally loading arrays."""
+    result = load(io.BytesIO(data.encode('utf-8')))
+    if isinstance(expected, dict):
+        assert result == expected
+    else:
+        assert not isinstance(result, list)
+        assert list(result) == expected
+
+
+def test_load_incremental():
+    """Test that array items are decoded while they are iterated."""
+    stream = io.BytesIO(b'[' + b', '.join([b'{"a": 1}'] * 10000) + b']')
+    items = load(stream)
+    assert next(items) == {'a': 1}
+    assert stream.tell() < len(stream.getvalue())
+    assert sum(1 for _ in items) == 9999
+
+
+def test_jsonl():
+    """Test dumping and loading JSON Lines."""
+    class Stream(io.BytesIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+
+    record = GroupableOrderedDict([('a', 1), ('b', 'x\ny'), ('a', (2, 3))])
+    items = [record, {'c': (4, )}, [], 'text'] * 3
+    stream = Stream()
+    dump_jsonl_stream(iter(items), stream, flush_interval=5)
+    assert stream.flushes == 3
+    assert stream.getvalue().decode('utf-8') == dump_jsonl(items) + '\n'
+    assert len(stream.getvalue().splitlines()) == len(items)
+
+    stream.seek(0)
+    assert list(load_jsonl(stream)) == json.loads(json.dumps(items))
+    assert list(load_jsonl(io.BytesIO(b'{"a": 1}\n\n[]\n'))) == [{'a': 1}, []]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 65536])
+def test_iter_json(chunk_size):
+    """Test reading JSON values one at a time."""
+    def values(data):
+        return list(iter_json(io.BytesIO(data.encode('utf-8')), chunk_size))
+
+    items = [{'a': 'M\u00fcller' * 10}, [1, [2]], 'x', 3.5, None, {}]
+    assert values(json.dumps(items)) == items
+    assert values(json.dumps(items, indent=2)) == items
+    lines = [item for item in items if not isinstance(item, list)]
+    assert values('\n'.join(json.dumps(item) for item in lines)) == lines
+    assert values(' [] {"a": 1}\n12 [3] ') == [{'a': 1}, 12, 3]
+    assert values('') == []
+
+    for data in ('[1, 2', '[1 2]', '[1,]', '[,1]', '{"a": 1'):
+        with pytest.raises(json.JSONDecodeError):
+            values(data)
+
+
+def test_iter_json_malformed():
+    """Test that malformed values are reported without reading further."""
+    data = '[{"a": 1}, {"a" 2}, ' + ', '.join(['{"a": 1}'] * 100000) + ']'
+    stream = io.BytesIO(data.encode('utf-8'))
+    values = iter_json(stream, 1024)
+
+    assert next(values) == {'a': 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(values)
+    assert stream.tell() < 4096